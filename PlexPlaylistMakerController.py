@@ -1,33 +1,913 @@
+import copy
+import csv
+import hashlib
+import html
 import json
-import imdb
+import os
+import sys
 import re
 import requests
-from bs4 import BeautifulSoup
-from threading import Thread
-from queue import Queue
+from threading import Event, Thread, Lock
+from queue import Empty, Queue
+from types import SimpleNamespace
 import webbrowser
-from plexapi.myplex import MyPlexPinLogin, MyPlexAccount
 import time
-from imdb import IMDbDataAccessError
 from abc import ABC, abstractmethod
 import random
 import logging
 import difflib
 import unicodedata
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait as wait_futures
+from contextlib import contextmanager
+from typing import Iterable, List, NamedTuple, Optional, Sequence
+# imdb (Cinemagoer), bs4 and plexapi are imported where first used so that
+# importing this module (app startup, fuzzy pool workers) stays cheap.
 
 # Configure a basic logger (prints to console). Users can customize or replace.
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s: %(message)s')
 
+# ---------------- Fuzzy scoring (module level so process-pool workers can use it) -----------------
+class SimilarityScorer(ABC):
+    """Picks the closest candidate form for a target form. Scores are 0..1."""
+    name = ''
+    threshold = 0.88  # Default acceptance threshold calibrated for this scorer
+
+    @abstractmethod
+    def best(self, target: str, candidates: Sequence[str], cutoff: float = 0.0):
+        """Return (best_form, score); best_form is None when nothing reaches ``cutoff``."""
+
+class DifflibScorer(SimilarityScorer):
+    """Pure-Python `difflib.SequenceMatcher.ratio` (always available)."""
+    name = 'difflib'
+    threshold = 0.88
+
+    def best(self, target, candidates, cutoff=0.0):
+        matcher = difflib.SequenceMatcher(None)
+        matcher.set_seq2(target)  # The target side is analysed once and reused
+        best_form = None
+        best_ratio = cutoff
+        for cand in candidates:
+            matcher.set_seq1(cand)
+            # Cheap upper bounds first; skip candidates that can't beat the current best
+            if matcher.real_quick_ratio() < best_ratio or matcher.quick_ratio() < best_ratio:
+                continue
+            r = matcher.ratio()
+            if r > best_ratio or (best_form is None and r == best_ratio):
+                best_ratio = r
+                best_form = cand
+        return best_form, (best_ratio if best_form else 0.0)
+
+class RapidfuzzScorer(SimilarityScorer):
+    """C-implemented `rapidfuzz.fuzz.ratio` via `process.extractOne` (optional dependency).
+
+    The Indel-based ratio is never below difflib's for the same pair, so the
+    calibrated threshold sits slightly higher.
+    """
+    name = 'rapidfuzz'
+    threshold = 0.90
+
+    def __init__(self):
+        from rapidfuzz import fuzz, process
+        self._fuzz = fuzz
+        self._process = process
+
+    def best(self, target, candidates, cutoff=0.0):
+        hit = self._process.extractOne(target, candidates, scorer=self._fuzz.ratio, score_cutoff=cutoff * 100)
+        if hit is None:
+            return None, 0.0
+        return hit[0], hit[1] / 100.0
+
+FUZZY_SCORERS = {'difflib': DifflibScorer, 'rapidfuzz': RapidfuzzScorer}
+_scorer_instances = {}
+
+def get_scorer(name: str = 'auto') -> SimilarityScorer:
+    """Return a (cached) scorer by name; 'auto' prefers rapidfuzz when installed."""
+    name = name or 'auto'
+    if name in _scorer_instances:
+        return _scorer_instances[name]
+    if name == 'auto':
+        try:
+            scorer = RapidfuzzScorer()
+        except ImportError:
+            scorer = DifflibScorer()
+        logging.debug(f"Fuzzy scorer: {scorer.name}")
+    elif name in FUZZY_SCORERS:
+        scorer = FUZZY_SCORERS[name]()
+    else:
+        raise ValueError(f"Unknown fuzzy scorer '{name}' (expected 'auto' or one of {sorted(FUZZY_SCORERS)}).")
+    _scorer_instances[name] = scorer
+    return scorer
+
+_POOL_STATE = ((), 'difflib', 0.0, {})  # (forms, scorer name, cutoff, forms by letter) of each fuzzy worker process
+
+def _bucket_forms(forms) -> dict:
+    """Group forms by their first letter (the narrowing `_fuzzy_best_form` applies)."""
+    buckets = {}
+    for form in forms:
+        if form and form[0].isalpha():
+            buckets.setdefault(form[0], []).append(form)
+    return buckets
+
+def _fuzzy_best_form(target: str, forms, scorer: str = 'difflib', cutoff: float = 0.0, by_letter=None):
+    """Return (best_form, score) for ``target`` among ``forms``.
+
+    Candidates are narrowed to forms sharing the target's first letter when
+    any exist; pass ``by_letter`` (see `_bucket_forms`) to avoid rescanning
+    ``forms`` for every target.
+    """
+    candidates = forms
+    if target and target[0].isalpha():
+        if by_letter is not None:
+            subset = by_letter.get(target[0])
+        else:
+            subset = [c for c in forms if c.startswith(target[0])]
+        if subset:
+            candidates = subset
+    if not candidates:
+        return None, 0.0
+    return get_scorer(scorer).best(target, candidates, cutoff)
+
+def _fuzzy_pool_init(forms, scorer='difflib', cutoff=0.0):
+    global _POOL_STATE
+    _POOL_STATE = (forms, scorer, cutoff, _bucket_forms(forms))
+
+def _fuzzy_pool_match(targets):
+    forms, scorer, cutoff, by_letter = _POOL_STATE
+    return [(t, *_fuzzy_best_form(t, forms, scorer, cutoff, by_letter)) for t in targets]
+
+class PlaylistCancelled(Exception):
+    """Raised inside a playlist job once its CancellationToken has been cancelled."""
+
+class CancellationToken:
+    """Cooperative cancellation flag for one playlist job.
+
+    Long-running steps call `raise_if_cancelled` between units of work and use
+    `sleep` / `wait_for` instead of blocking waits, so a cancel takes effect
+    within ``POLL`` seconds. Callbacks registered with `on_cancel` (e.g.
+    closing HTTP sessions) run once, on the cancelling thread.
+    """
+    POLL = 0.25
+
+    def __init__(self):
+        self._event = Event()
+        self._lock = Lock()
+        self._callbacks = []
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            try:
+                fn()
+            except Exception as e:
+                logging.debug(f"Cancel callback raised: {e}")
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise PlaylistCancelled()
+
+    def sleep(self, seconds: float):
+        """`time.sleep` that ends early (raising PlaylistCancelled) on cancel."""
+        if self._event.wait(max(0.0, seconds)):
+            raise PlaylistCancelled()
+
+    def wait_for(self, future):
+        """Return ``future.result()``, raising PlaylistCancelled if cancelled while waiting."""
+        while not wait_futures([future], timeout=self.POLL).done:
+            self.raise_if_cancelled()
+        return future.result()
+
+    def on_cancel(self, fn):
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(fn)
+                return
+        fn()
+
+class ProgressEvent(NamedTuple):
+    """Snapshot of a running playlist job, delivered through ``progress_channel``."""
+    stage: str                   # 'index', 'fetch', 'resolve', 'match', 'write' or 'done'
+    pages_fetched: int
+    pages_total: Optional[int]
+    titles_resolved: int         # titles known so far (parsed or fetched)
+    titles_total: Optional[int]  # best estimate of list size, None while unknown
+    matched: int
+    unmatched: int
+    elapsed: float               # seconds since the job started
+    eta: Optional[float]         # seconds remaining, None while unknown
+
+    @property
+    def processed(self) -> int:
+        return self.matched + self.unmatched
+
+    @property
+    def throughput(self) -> float:
+        """Titles matched (or rejected) per second."""
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class ProgressTracker:
+    """Thread-safe job counters that emit throttled ProgressEvents to a channel.
+
+    The channel is any object with ``put`` (normally a queue.Queue read by the
+    GUI). Events are rate limited to one per ``min_interval`` seconds unless
+    forced, so very large lists don't flood the consumer.
+    """
+    def __init__(self, channel=None, min_interval: float = 0.1):
+        self.channel = channel
+        self.min_interval = min_interval
+        self.stage = 'fetch'
+        self.pages_fetched = 0
+        self.pages_total = None
+        self.titles_resolved = 0
+        self.titles_total = None
+        self.matched = 0
+        self.unmatched = 0
+        self._lock = Lock()
+        self._t0 = time.perf_counter()
+        self._last_emit = 0.0
+
+    def update(self, stage: str = None, force: bool = False, pages_total: int = None, titles_total: int = None, **increments):
+        """Advance counters (e.g. ``matched=1``), optionally set totals/stage, then maybe emit."""
+        if self.channel is None:
+            return
+        with self._lock:
+            if stage:
+                self.stage = stage
+            if pages_total is not None:
+                self.pages_total = pages_total
+            if titles_total is not None:
+                self.titles_total = titles_total
+            for name, n in increments.items():
+                setattr(self, name, getattr(self, name) + n)
+            now = time.perf_counter()
+            if not force and now - self._last_emit < self.min_interval:
+                return
+            self._last_emit = now
+            event = self._snapshot(now - self._t0)
+        try:
+            self.channel.put(event)
+        except Exception:
+            pass
+
+    def _snapshot(self, elapsed: float) -> ProgressEvent:
+        total = self.titles_total
+        if total is None and self.pages_total and self.pages_fetched:
+            # Estimate list size from the average page size seen so far
+            total = round(self.titles_resolved / self.pages_fetched * self.pages_total)
+        processed = self.matched + self.unmatched
+        eta = None
+        if total and processed:
+            eta = max(0.0, elapsed / processed * (total - processed))
+        return ProgressEvent(self.stage, self.pages_fetched, self.pages_total, self.titles_resolved,
+                             total, self.matched, self.unmatched, round(elapsed, 3),
+                             None if eta is None else round(eta, 1))
+
+
+class RunReport:
+    """Structured timing record for a single playlist run.
+
+    Stage timings are accumulated (seconds) and counters incremented from any
+    thread; `to_dict` produces the JSON-serializable record written per run.
+    """
+    def __init__(self, source: str, **fields):
+        self.source = source
+        self.fields = dict(fields)
+        self.timings = {}
+        self.counts = {}
+        self._lock = Lock()
+        self._started_at = time.time()
+        self._t0 = time.perf_counter()
+        self.progress = ProgressTracker()  # Replaced per job when a progress channel is set
+        self.cancel = CancellationToken()  # Replaced per job by the caller's token
+        self.match_methods = None  # id(ListEntry) -> (match method, score); only collected for match plans
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float):
+        with self._lock:
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def count(self, name: str, n: int = 1):
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + n
+
+    def set(self, **fields):
+        with self._lock:
+            self.fields.update(fields)
+
+    def mark(self, name: str):
+        """Record seconds elapsed since the run started under ``name`` (first call wins)."""
+        with self._lock:
+            self.fields.setdefault(name, round(time.perf_counter() - self._t0, 4))
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                'source': self.source,
+                'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self._started_at)),
+                'wall_s': round(time.perf_counter() - self._t0, 4),
+                **self.fields,
+                'timings_s': {k: round(v, 4) for k, v in self.timings.items()},
+                'counts': dict(self.counts),
+            }
+
+class IndexedItem:
+    """Compact library index record: just enough to match and to fetch the item later.
+
+    Attribute names mirror plexapi (``ratingKey``, ``title``...) so records and
+    full Plex objects can be handled the same way by the matching code. Full
+    objects are only materialized for the final matched set
+    (see `PlexBaseApp._materialize_items`).
+    """
+    __slots__ = ('ratingKey', 'title', 'year', 'type', 'guids')
+
+    def __init__(self, ratingKey, title, year=None, type=None, guids=()):
+        self.ratingKey = int(ratingKey)
+        self.title = title
+        self.year = int(year) if year else None
+        self.type = sys.intern(type) if type else None
+        self.guids = tuple(guids)  # e.g. ('imdb://tt0133093', 'tmdb://603')
+
+    @classmethod
+    def from_element(cls, elem):
+        """(record, (originalTitle, titleSort)) from a library XML element, or None without key / title."""
+        attrs = elem.attrib
+        if not attrs.get('ratingKey') or not attrs.get('title'):
+            return None
+        guids = [g.attrib['id'] for g in elem.iter('Guid') if g.attrib.get('id')]
+        if attrs.get('guid', '').startswith('com.plexapp.agents.'):
+            guids.append(attrs['guid'])  # Legacy agents only expose the primary GUID
+        record = cls(attrs['ratingKey'], attrs['title'], attrs.get('year'), attrs.get('type'), guids)
+        return record, (attrs.get('originalTitle'), attrs.get('titleSort'))
+
+    @classmethod
+    def from_plex(cls, item):
+        """Build a record from a plexapi Video/Show object."""
+        return cls.from_plex_with_titles(item)[0]
+
+    @classmethod
+    def from_plex_with_titles(cls, item):
+        """(record, (originalTitle, titleSort)) for a plexapi object.
+
+        Read from the object's XML (``_data``): attribute access on a partial
+        plexapi object reloads it from the server whenever the value is None
+        or empty, i.e. one request per item without an originalTitle.
+        """
+        data = getattr(item, '_data', None)
+        parsed = cls.from_element(data) if data is not None else None
+        if parsed is not None:
+            return parsed
+        guids = [g.id for g in (getattr(item, 'guids', None) or []) if getattr(g, 'id', None)]
+        record = cls(item.ratingKey, item.title, getattr(item, 'year', None), getattr(item, 'type', None), guids)
+        return record, (getattr(item, 'originalTitle', None), getattr(item, 'titleSort', None))
+
+    def __repr__(self):
+        return f"IndexedItem({self.ratingKey}, {self.title!r}, {self.year})"
+
+
+class LibraryIndex(dict):
+    """Canonical form -> [IndexedItem] map of one library, plus its fuzzy candidates.
+
+    Keys containing '|' (year-qualified and GUID keys) are exact lookups only.
+    The remaining plain forms, also bucketed by first letter, are what fuzzy
+    matching scores against; `freeze` computes them once when the build is
+    done instead of for every fuzzy title.
+    """
+    __slots__ = ('plain_forms', 'forms_by_letter')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.plain_forms = None
+        self.forms_by_letter = None
+
+    def freeze(self) -> 'LibraryIndex':
+        self.plain_forms = tuple(c for c in self if '|' not in c)
+        self.forms_by_letter = _bucket_forms(self.plain_forms)
+        return self
+
+
+class ListEntry:
+    """Compact record for one list item travelling from the fetcher to the matcher.
+
+    Only unmatched entries are ever expanded to dicts (`to_dict`, used for the
+    Export Missing CSV), which keeps very large lists cheap to hold.
+    """
+    __slots__ = ('position', 'title', 'year', 'original_title', 'imdb_id', 'film_id', 'slug', 'tmdb_id')
+
+    def __init__(self, position=0, title=None, year=None, original_title=None, imdb_id=None, film_id=None, slug=None,
+                 tmdb_id=None):
+        self.position = position
+        self.title = title
+        self.year = int(year) if year else None
+        self.original_title = original_title
+        self.imdb_id = imdb_id
+        self.film_id = film_id
+        self.slug = slug
+        self.tmdb_id = tmdb_id  # imdb_id / tmdb_id let the matcher look items up by Plex GUID
+
+    @property
+    def guids(self):
+        """Plex GUIDs this entry is known by, e.g. ('imdb://tt0133093', 'tmdb://603')."""
+        return tuple(g for g in (self.imdb_id and f'imdb://{self.imdb_id}',
+                                 self.tmdb_id and f'tmdb://{self.tmdb_id}') if g)
+
+    @property
+    def url(self):
+        if self.slug:
+            return f'https://letterboxd.com/film/{self.slug}'
+        if self.imdb_id:
+            return f'https://www.imdb.com/title/{self.imdb_id}/'
+        return None
+
+    def to_dict(self) -> dict:
+        """Source-specific detail dict (the keys present decide the exported CSV columns)."""
+        d = {'title': self.title, 'year': self.year, 'position': self.position}
+        if self.imdb_id:
+            d.update(imdb_id=self.imdb_id, imdb_url=f'https://www.imdb.com/title/{self.imdb_id}/')
+        if self.slug:
+            d.update(original_title=self.original_title, film_id=self.film_id, slug=self.slug, url=self.url)
+        return d
+
+    @classmethod
+    def from_dict(cls, d: dict) -> 'ListEntry':
+        """Inverse of `to_dict`; also accepts rows read back by `read_missing_csv`."""
+        return cls(int(d.get('position') or 0), d.get('title'), d.get('year') or None, d.get('original_title') or None,
+                   d.get('imdb_id') or None, d.get('film_id') or None, d.get('slug') or None,
+                   d.get('tmdb_id') or None)
+
+    def __repr__(self):
+        return f"ListEntry({self.position}, {self.title!r}, {self.year})"
+
+
+# Export Missing CSV header -> ListEntry field (columns written by the GUI's export_missing_titles)
+MISSING_CSV_COLUMNS = {'Position': 'position', 'Title': 'title', 'Year': 'year', 'IMDb ID': 'imdb_id',
+                       'Original Title': 'original_title', 'Film ID': 'film_id', 'Slug': 'slug'}
+
+
+def read_missing_csv(path: str) -> List[ListEntry]:
+    """Read the entries of an exported Missing CSV back (for `PlexBaseApp.rematch_playlist`)."""
+    with open(path, newline='', encoding='utf-8') as f:
+        return [ListEntry.from_dict({MISSING_CSV_COLUMNS[k]: v for k, v in row.items() if k in MISSING_CSV_COLUMNS})
+                for row in csv.DictReader(f) if row.get('Title')]
+
+
+class MatchReport:
+    """Outcome of matching one list, assembled in a single pass.
+
+    Results are ordered by list position, then walked once to collect the
+    de-duplicated matched items (list order) and the unmatched entries. The
+    playlist write, the summary message and the Export Missing CSV all read
+    from here; unmatched entries keep their own position, so duplicate titles
+    stay distinct rows.
+    """
+    def __init__(self, results):
+        self.matched_items = []  # IndexedItem records, first occurrence wins
+        self.unmatched = []      # ListEntry records in list order
+        seen_keys = set()
+        titles = set()
+        for entry, item in sorted(results, key=lambda r: r[0].position):
+            titles.add(entry.title)
+            if item is None:
+                self.unmatched.append(entry)
+            elif item.ratingKey not in seen_keys:
+                seen_keys.add(item.ratingKey)
+                self.matched_items.append(item)
+        self.total = len(results)
+        self.distinct_titles = len(titles)
+
+    @property
+    def unmatched_titles(self) -> List[str]:
+        return [entry.title for entry in self.unmatched]
+
+    def unmatched_details(self) -> List[dict]:
+        """Export rows (see `ListEntry.to_dict`), aligned with `unmatched_titles`."""
+        return [entry.to_dict() for entry in self.unmatched]
+
+
+class ServerOutcome(NamedTuple):
+    """Result of publishing one list to one server (see `PlexBaseApp.mirror_playlist`)."""
+    server: str
+    success: bool
+    matched: int = 0
+    unmatched: Sequence['ListEntry'] = ()
+    error: Optional[str] = None
+    timings: Optional[dict] = None
+
+    def summary(self) -> str:
+        if self.error:
+            return f"{self.server}: failed ({self.error})"
+        if not self.success:
+            return f"{self.server}: nothing matched"
+        missing = f", {len(self.unmatched)} not found" if self.unmatched else ""
+        return f"{self.server}: {self.matched} matched{missing}"
+
+
+class MatchPlan:
+    """Serializable dry-run result: what a playlist would contain, before anything is written.
+
+    One row per list entry in list order: the entry's fields, the chosen Plex
+    ``rating_key`` / ``plex_title`` (None when unmatched), the match ``method``
+    and a similarity ``score`` (the ratio that accepted a fuzzy match, else 1.0). `to_dict` /
+    `from_dict` round-trip through JSON; `PlexBaseApp.commit_plan` writes a
+    plan without fetching or matching again.
+    """
+    def __init__(self, source: str, list_url: str, server_id, library, playlist_name: str, rows: list,
+                 fetch_failures: int = 0):
+        self.source = source
+        self.list_url = list_url
+        self.server_id = server_id
+        self.library = library
+        self.playlist_name = playlist_name
+        self.rows = rows
+        self.fetch_failures = fetch_failures
+
+    @classmethod
+    def from_results(cls, source, list_url, server_id, library, playlist_name, results, methods,
+                     fetch_failures=0):
+        """Build from match results; ``methods`` maps id(entry) -> (method, score) as recorded while matching."""
+        rows = []
+        for entry, item in sorted(results, key=lambda r: r[0].position):
+            method, score = methods.get(id(entry), (None, None)) if item is not None else (None, None)
+            rows.append({
+                'entry': {name: getattr(entry, name) for name in ListEntry.__slots__},
+                'rating_key': item.ratingKey if item is not None else None,
+                'plex_title': item.title if item is not None else None,
+                'plex_year': item.year if item is not None else None,
+                'method': method,
+                'score': (round(score, 4) if score is not None else 1.0) if item is not None else None,
+            })
+        return cls(source, list_url, server_id, library, playlist_name, rows, fetch_failures)
+
+    def entries(self) -> List['ListEntry']:
+        return [ListEntry(**row['entry']) for row in self.rows]
+
+    @property
+    def matched(self) -> list:
+        return [row for row in self.rows if row['rating_key'] is not None]
+
+    @property
+    def unmatched(self) -> list:
+        return [row for row in self.rows if row['rating_key'] is None]
+
+    def rating_keys(self) -> List[int]:
+        """Distinct matched rating keys in list order (what the playlist will hold)."""
+        return list(dict.fromkeys(row['rating_key'] for row in self.matched))
+
+    def unmatched_titles(self) -> List[str]:
+        return [row['entry']['title'] for row in self.unmatched]
+
+    def unmatched_details(self) -> List[dict]:
+        """Export rows for the Missing CSV (see `ListEntry.to_dict`)."""
+        return [ListEntry(**row['entry']).to_dict() for row in self.unmatched]
+
+    def summary(self) -> str:
+        methods = {}
+        for row in self.matched:
+            methods[row['method']] = methods.get(row['method'], 0) + 1
+        by_method = ', '.join(f"{n} {m or 'other'}" for m, n in sorted(methods.items(), key=lambda kv: -kv[1]))
+        text = (f"'{self.playlist_name}' would get {len(self.rating_keys())} item(s): "
+                f"{len(self.matched)} of {len(self.rows)} titles matched" + (f" ({by_method})" if by_method else "") +
+                f", {len(self.unmatched)} not found.")
+        if self.fetch_failures:
+            text += f" {self.fetch_failures} failed to fetch."
+        return text
+
+    def to_dict(self) -> dict:
+        return {'source': self.source, 'list_url': self.list_url, 'server_id': self.server_id,
+                'library': self.library, 'playlist_name': self.playlist_name, 'rows': self.rows,
+                'fetch_failures': self.fetch_failures}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'MatchPlan':
+        return cls(data['source'], data['list_url'], data.get('server_id'), data.get('library'),
+                   data.get('playlist_name') or '', data.get('rows') or [], data.get('fetch_failures') or 0)
+
+
+class LibraryIndexService:
+    """Library indexes, match cache and HTTP sessions shared by all source controllers.
+
+    The application owns one instance and hands it to every controller it
+    creates, so switching between IMDb and Letterboxd never re-indexes a
+    library. Indexes are keyed by (server machineIdentifier, library name),
+    which keeps them valid for the lifetime of a server connection without
+    leaking between servers. All state is guarded by a single lock.
+    """
+    def __init__(self):
+        self.lock = Lock()
+        self.indexes = {}       # (server_id, library_name) -> {canonical_form: [IndexedItem]}
+        self.index_builds = {}  # (server_id, library_name) -> Future of an in-flight build
+        self.match_cache = {}   # (server_id, library_name, raw_title, year) -> (item, method, score); hits only
+        self.film_ids = {}      # Letterboxd slug -> (tmdb_id, imdb_id) read from its film page
+        self._sessions = {}     # name -> requests.Session
+        self._in_flight = {}    # single_flight key -> Future of the running call
+
+    def session(self, name: str) -> requests.Session:
+        """Return the pooled HTTP session for ``name`` (e.g. 'letterboxd'), creating it once."""
+        with self.lock:
+            sess = self._sessions.get(name)
+            if sess is None:
+                sess = self._sessions[name] = requests.Session()
+            return sess
+
+    def single_flight(self, key, fn, cancel=None):
+        """Return ``fn()``, sharing one call between concurrent callers with the same ``key``.
+
+        The first caller runs ``fn``; callers arriving while it runs wait for
+        and receive the same result (or exception) instead of repeating the
+        request. Nothing is kept once the call finishes. A waiter's ``cancel``
+        token ends its own wait; if the running call was cancelled by its own
+        job, a waiter that is still live takes over and runs ``fn`` itself.
+        """
+        while True:
+            with self.lock:
+                pending = self._in_flight.get(key)
+                leader = pending is None
+                if leader:
+                    pending = self._in_flight[key] = Future()
+            if leader:
+                try:
+                    result = fn()
+                except BaseException as e:
+                    pending.set_exception(e)
+                    raise
+                else:
+                    pending.set_result(result)
+                    return result
+                finally:
+                    with self.lock:
+                        self._in_flight.pop(key, None)
+            logging.debug(f"Joining in-flight request {key!r}")
+            try:
+                return cancel.wait_for(pending) if cancel is not None else pending.result()
+            except PlaylistCancelled:
+                if cancel is not None and cancel.cancelled:
+                    raise
+                # The other job was cancelled mid-request; retry on our own behalf
+
+    def invalidate(self, server_id=None, library_name=None):
+        """Drop indexes and cached matches, optionally only for one server / library."""
+        def hit(key):
+            return (server_id is None or key[0] == server_id) and \
+                (library_name is None or key[1] == library_name)
+        with self.lock:
+            for key in [k for k in self.indexes if hit(k)]:
+                del self.indexes[key]
+            for key in [k for k in self.match_cache if hit(k)]:
+                del self.match_cache[key]
+
+    def close(self):
+        """Close pooled HTTP sessions (they are recreated on next use)."""
+        with self.lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for sess in sessions:
+            sess.close()
+
+
+class SessionStore:
+    """Persists the Plex sign-in and the last known servers / libraries between launches.
+
+    The auth token is only ever kept in the OS credential store (Windows
+    Credential Manager, macOS Keychain, Secret Service) through ``keyring``;
+    without a usable keyring it is not persisted and every launch signs in
+    again. The state file (written atomically, owner-only where the OS honours
+    it) holds no secrets: server and library metadata are only a startup
+    cache that `PlexBaseApp.resume_session` revalidates in the background.
+    """
+    KEYRING_SERVICE = 'PlexPlaylistMaker'
+
+    def __init__(self, path: str = 'PlexPlaylistMaker_session.json'):
+        self.path = path
+        self._lock = Lock()
+
+    @staticmethod
+    def _keyring():
+        try:
+            import keyring
+            return keyring
+        except ImportError:
+            return None
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def load(self) -> dict:
+        """Return {'token', 'servers', 'server', 'connections', 'libraries'} (missing keys when unknown)."""
+        with self._lock:
+            state = self._read()
+        state.pop('token', None)  # Plaintext tokens written by older versions are not trusted
+        if state.get('token_in_keyring'):
+            kr = self._keyring()
+            try:
+                state['token'] = kr.get_password(self.KEYRING_SERVICE, 'token') if kr else None
+            except Exception as e:
+                logging.warning(f"Could not read the Plex token from the keyring: {e}")
+        return state
+
+    def save(self, token=None, servers=None, server=None, uri=None, libraries=None):
+        """Merge the given fields into the stored state; ``uri`` / ``libraries`` belong to ``server``."""
+        with self._lock:
+            state = self._read()
+            state.pop('token', None)
+            if token:
+                kr = self._keyring()
+                try:
+                    if kr is None:
+                        raise RuntimeError("the keyring package is not installed")
+                    kr.set_password(self.KEYRING_SERVICE, 'token', token)
+                    state['token_in_keyring'] = True
+                except Exception as e:
+                    logging.warning(f"Plex sign-in not remembered ({e}); you will be asked to sign in next time.")
+                    state.pop('token_in_keyring', None)
+            if servers is not None:
+                state['servers'] = list(servers)
+            if server:
+                state['server'] = server
+                if uri:
+                    state.setdefault('connections', {})[server] = uri
+                if libraries is not None:
+                    state.setdefault('libraries', {})[server] = list(libraries)
+            self._write(state)
+
+    def clear(self):
+        """Forget the stored sign-in and cached metadata."""
+        with self._lock:
+            state = self._read()
+            if state.get('token_in_keyring'):
+                kr = self._keyring()
+                try:
+                    if kr:
+                        kr.delete_password(self.KEYRING_SERVICE, 'token')
+                except Exception:
+                    pass
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def _write(self, state: dict):
+        try:
+            _write_json_atomic(self.path, state)
+        except OSError as e:
+            logging.warning(f"Could not save the Plex session to '{self.path}': {e}")
+
+
+def _write_json_atomic(path: str, data, mode: int = 0o600):
+    """Write ``data`` as JSON via a temp file + rename, so readers never see a partial file."""
+    tmp = f"{path}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+class ScrapeCheckpoint:
+    """On-disk progress of one Letterboxd list scrape, so an interrupted run can resume.
+
+    Holds the parsed entries of every completed list page, the pages that
+    failed and the titles resolved from film pages. One JSON file per list URL
+    (hashed name) in ``directory``; it is rewritten atomically after each page
+    and at most every ``save_interval`` seconds for film results, and deleted
+    once a scrape finishes with nothing left to retry. A checkpoint is ignored
+    ``ttl`` seconds after it was created (re-saving doesn't extend that), so a
+    list edited since is fetched fresh.
+    """
+    VERSION = 2
+
+    def __init__(self, directory: str, list_url: str, ttl: float = 24 * 3600, save_interval: float = 2.0):
+        digest = hashlib.sha1(list_url.encode('utf-8')).hexdigest()[:16]
+        self.path = os.path.join(directory, f"letterboxd_{digest}.json")
+        self.list_url = list_url
+        self.save_interval = save_interval
+        self._lock = Lock()
+        self._last_save = 0.0
+        self._dirty = False
+        self.state = self._load(ttl)
+        self.resumed = bool(self.state['pages'] or self.state['films'])
+
+    def _load(self, ttl: float) -> dict:
+        fresh = {'version': self.VERSION, 'url': self.list_url, 'created_at': time.time(), 'pages_total': None,
+                 'pages': {}, 'failed_pages': [], 'films': {}}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return fresh
+        if state.get('version') != self.VERSION or state.get('url') != self.list_url:
+            return fresh
+        if time.time() - (state.get('created_at') or 0) > ttl:
+            return fresh
+        return state
+
+    # Page rows are compact lists: [slug, film_id, title, year, original_title]
+    def page(self, number: int):
+        """ListEntry records of a completed page, or None when it still has to be fetched."""
+        with self._lock:
+            rows = self.state['pages'].get(str(number))
+        if rows is None:
+            return None
+        return [ListEntry(title=title, year=year, original_title=original, film_id=film_id, slug=sys.intern(slug))
+                for slug, film_id, title, year, original in rows]
+
+    def store_page(self, number: int, entries, pages_total=None):
+        with self._lock:
+            self.state['pages'][str(number)] = [[e.slug, e.film_id, e.title, e.year, e.original_title] for e in entries]
+            if number in self.state['failed_pages']:
+                self.state['failed_pages'].remove(number)
+            if pages_total:
+                self.state['pages_total'] = pages_total
+        self.save(force=True)
+
+    def page_failed(self, number: int):
+        with self._lock:
+            if number not in self.state['failed_pages']:
+                self.state['failed_pages'].append(number)
+        self.save(force=True)
+
+    @property
+    def pages_total(self):
+        return self.state['pages_total']
+
+    # Film rows: slug -> [title, year, tmdb_id, imdb_id]; title None = page gone / unusable (not retried)
+    def film(self, slug: str):
+        with self._lock:
+            return self.state['films'].get(slug)
+
+    def store_film(self, slug: str, title: str, year=None, tmdb_id=None, imdb_id=None):
+        with self._lock:
+            self.state['films'][slug] = [title, year, tmdb_id, imdb_id]
+            self._dirty = True
+        self.save()
+
+    def save(self, force: bool = False):
+        with self._lock:
+            now = time.time()
+            if not force and (not self._dirty or now - self._last_save < self.save_interval):
+                return
+            self._dirty = False
+            self._last_save = now
+            try:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                _write_json_atomic(self.path, self.state)
+            except OSError as e:
+                logging.warning(f"Could not write scrape checkpoint '{self.path}': {e}")
+
+    def finish(self, complete: bool):
+        """Delete the checkpoint after a complete scrape, otherwise flush it for the next run."""
+        if not complete and (self.state['pages'] or self.state['films']):
+            self.save(force=True)
+            return
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
 class PlexBaseApp(ABC):
-    def __init__(self, server=None):
+    def __init__(self, server=None, service=None):
         self.server = server  # Server connection (plexapi.server.PlexServer)
         self.plex_account = None  # MyPlexAccount after authentication
         self.libraries = []  # Cached libraries metadata
-        # Fuzzy matching support
-        self._title_index = {}  # library_name -> {canonical_form: [items]}
-        self.FUZZY_THRESHOLD = 0.88
+        # Library indexes, match cache and HTTP sessions (shareable between controllers)
+        self.service = service or LibraryIndexService()
+        self.FUZZY_SCORER = 'auto'        # 'auto' (rapidfuzz if installed), 'difflib' or 'rapidfuzz'
+        self.FUZZY_THRESHOLD = None       # None = the scorer's calibrated threshold
+        # Opt-in multi-process fuzzy stage for large lists (CPU bound, otherwise limited to one core)
+        self.FUZZY_PROCESS_POOL = False
+        self.FUZZY_WORKERS = None         # None = os.cpu_count()
+        self.FUZZY_POOL_MIN_TITLES = 50   # Below this many fuzzy lookups the pool isn't worth starting
+        self.MATERIALIZE_BATCH = 500  # Rating keys per fetchItems request when loading matched items
+        # Multi-library jobs: library names tried first when a title is in several (others keep their order)
+        self.LIBRARY_PREFERENCE = []
+        # Paged library scan used to build indexes
+        self.INDEX_PAGE_SIZE = 1000   # Items per container window
+        self.INDEX_PAGE_WORKERS = 4   # Concurrent window requests
+        # Run reports: one JSON line per create_plex_playlist run (None disables the file)
+        self.RUN_REPORT_PATH = 'PlexPlaylistMaker_runs.jsonl'
+        self.metrics_hook = None  # Optional callable(record_dict) for external metrics
+        # Progress events: object with put() (e.g. queue.Queue) receiving ProgressEvent snapshots
+        self.progress_channel = None
+        self.PROGRESS_INTERVAL = 0.1  # Minimum seconds between non-final progress events
+        # Persisted sign-in / server / library cache (SessionStore, set by the app; None disables)
+        self.session_store = None
+        self.SESSION_CONNECT_TIMEOUT = 5  # Seconds for the direct connect to the cached server URI
 
     # ---------------- Normalization helpers -----------------
     @staticmethod
@@ -56,6 +936,14 @@ class PlexBaseApp(ABC):
         forms = {base, re.sub(r'^(the|a|an)\s+', '', base)}
         return {f for f in forms if f}
 
+    @staticmethod
+    def _split_title_year(text: str):
+        """Split "Title (1999)" into ("Title", 1999); year is None when absent."""
+        m = re.match(r'^(.*?)\s*\((\d{4})\)$', (text or '').strip())
+        if m and m.group(1):
+            return m.group(1).strip(), int(m.group(2))
+        return (text or '').strip(), None
+
     def _match_titles_batched(self, library_name: str, titles: Sequence[str]) -> List[object]:
         """Common batched matching logic used by subclasses."""
         large_threshold = getattr(self, 'LARGE_LIST_THRESHOLD', 500)
@@ -83,24 +971,700 @@ class PlexBaseApp(ABC):
                     matched_items.append(item)
         return matched_items
 
-    def _ensure_library_index(self, library_name: str, library):
-        if library_name in self._title_index:
-            return
-        idx = {}
+    def _index_key(self, library_name: str, server=None):
+        return (getattr(server or self.server, 'machineIdentifier', None), library_name)
+
+    def _get_library_index(self, library_name: str) -> dict:
+        with self.service.lock:
+            return self.service.indexes.get(self._index_key(library_name), {})
+
+    def _ensure_library_index(self, library_name: str, library=None, cancel=None):
+        """Block until the index for ``library_name`` is ready, building it if needed.
+
+        With a ``cancel`` token the wait is abandoned on cancel; the shared
+        build itself keeps running for other jobs.
+        """
+        pending = self.prefetch_library_index(library_name, library)
+        if pending is not None:
+            if cancel is not None:
+                cancel.wait_for(pending)
+            else:
+                pending.result()
+
+    def prefetch_library_index(self, library_name: str, library=None):
+        """Start building the index for ``library_name`` on a background thread.
+
+        Safe to call repeatedly: returns None when the index is already built,
+        otherwise the Future of the (possibly already running) build. Matching
+        awaits the same Future, so list fetching and indexing overlap.
+        The build uses the server connected now, even if the controller is
+        switched to another server while it runs.
+        """
+        if not library_name:
+            return None
+        server = self.server
+        key = self._index_key(library_name, server)
+        service = self.service
+        with service.lock:
+            if key in service.indexes:
+                return None
+            pending = service.index_builds.get(key)
+            if pending is not None:
+                return pending
+            pending = Future()
+            service.index_builds[key] = pending
+
+        def run():
+            try:
+                idx = self._build_library_index(library_name, library, server)
+                if idx is not None:  # A failed build isn't stored, so the next job retries it
+                    with service.lock:
+                        service.indexes[key] = idx.freeze()
+            finally:
+                with service.lock:
+                    service.index_builds.pop(key, None)
+                pending.set_result(None)
+
+        Thread(target=run, name=f"index-{library_name}", daemon=True).start()
+        return pending
+
+    def _library_names(self, library_name) -> List[str]:
+        """``library_name`` as an ordered list of section names.
+
+        Jobs take a single name or a sequence of names; several names are
+        matched together and LIBRARY_PREFERENCE (then the given order) decides
+        which library wins when a title is found in more than one.
+        """
+        names = [library_name] if isinstance(library_name, str) else list(dict.fromkeys(library_name))
+        if self.LIBRARY_PREFERENCE:
+            rank = {name: i for i, name in enumerate(self.LIBRARY_PREFERENCE)}
+            names.sort(key=lambda name: rank.get(name, len(rank)))
+        return names
+
+    def prefetch_library_indexes(self, library_name):
+        """`prefetch_library_index` for every library of a (multi-library) job; the builds run concurrently."""
+        for name in self._library_names(library_name):
+            self.prefetch_library_index(name)
+
+    def refresh_library_index(self, library_name: str):
+        """Discard the cached index / matches for ``library_name`` and rebuild in the background."""
+        self.service.invalidate(*self._index_key(library_name))
+        return self.prefetch_library_index(library_name)
+
+    def _build_library_index(self, library_name: str, library=None, server=None) -> Optional[LibraryIndex]:
+        """Scan ``library_name`` on ``server`` (default: the current one) into a new index.
+
+        Returns None when the library couldn't be read.
+        """
+        server = server or self.server
+        idx = LibraryIndex()
+        try:
+            if library is None:
+                if server is None:
+                    raise RuntimeError("server connection is not established")
+                library = server.library.section(library_name)
+            try:
+                pages = self._iter_library_records_paged(library_name, library, server)
+                for records in pages:
+                    self._fold_into_index(idx, records)
+            except Exception as e:
+                # Older servers / unexpected payloads: fall back to one plexapi library.all()
+                logging.warning(f"Paged scan of library '{library_name}' failed ({e}); falling back to a full listing.")
+                idx = LibraryIndex()
+                self._fold_into_index(idx, (IndexedItem.from_plex_with_titles(item) for item in library.all()))
+            logging.info(f"Indexed {len(idx)} canonical forms for library '{library_name}'.")
+        except Exception as e:
+            logging.error(f"Failed to build index for library '{library_name}': {e}")
+            return None
+        return idx
+
+    def _fold_into_index(self, idx: dict, records):
+        """Add (record, alt_titles) pairs to ``idx``.
+
+        Every canonical form of the title, originalTitle and titleSort is a key,
+        plus a year-qualified "form|year" key for each, plus a "guid|<guid>" key
+        per external ID (e.g. "guid|imdb://tt0133093"). Canonical forms never
+        contain '|', so fuzzy matching can skip the year and GUID keys cheaply.
+        """
+        for record, alt_titles in records:
+            for guid in record.guids:
+                idx.setdefault(f"guid|{self._normalize_guid(guid)}", []).append(record)
+            forms = self._canonical_forms(record.title)
+            for alt in alt_titles:
+                if alt and alt != record.title:
+                    forms |= self._canonical_forms(alt)
+            for form in forms:
+                idx.setdefault(form, []).append(record)
+                if record.year:
+                    idx.setdefault(f"{form}|{record.year}", []).append(record)
+
+    _LEGACY_GUID_RE = re.compile(r'^com\.plexapp\.agents\.(imdb|themoviedb)://([^?/]+)')
+
+    @classmethod
+    def _normalize_guid(cls, guid: str) -> str:
+        """Map legacy agent GUIDs (com.plexapp.agents.imdb://tt..?lang=en) to the imdb:// / tmdb:// form."""
+        m = cls._LEGACY_GUID_RE.match(guid)
+        if m:
+            return f"{'tmdb' if m.group(1) == 'themoviedb' else 'imdb'}://{m.group(2)}"
+        return guid
+
+    def _match_ids(self, entry, index: dict):
+        """Direct lookup of an entry's external IDs against Plex GUIDs; None when nothing is known."""
+        for guid in entry.guids:
+            candidates = index.get(f"guid|{guid}")
+            if candidates:
+                return self._pick_candidate(candidates, '', entry.title, entry.year)
+        return None
+
+    def _pick_candidate(self, candidates: list, form: str, raw_title: str, year=None):
+        """Choose among index records sharing a key (remakes, alternate-title clashes).
+
+        Preference: exact year, then year off by one (release vs. premiere
+        dates), then records whose main title (not an alternate) produced the
+        form, then a case-insensitive title match; ties keep library order.
+        """
+        if len(candidates) == 1:
+            return candidates[0]
+        raw_lower = (raw_title or '').lower()
+
+        def rank(record):
+            year_rank = 2
+            if year and record.year:
+                year_rank = 0 if record.year == year else (1 if abs(record.year - year) == 1 else 3)
+            main_title = form.split('|', 1)[0] in self._canonical_forms(record.title)
+            return (year_rank, not main_title, record.title.lower() != raw_lower)
+        return min(candidates, key=rank)
+
+    def _iter_library_records_paged(self, library_name: str, library, server):
+        """Yield lists of (IndexedItem, alt_titles) for a library section, one page at a time.
+
+        The first window reveals the section size; the remaining container
+        windows (INDEX_PAGE_SIZE items each) are requested concurrently over the
+        server's pooled session and yielded as they arrive, so each page is
+        folded into the index while the others are still in flight. Items are
+        read straight from the XML, never constructing plexapi objects.
+        """
+        key = f'/library/sections/{library.key}/all'
+        size = self.INDEX_PAGE_SIZE
+        records, total = self._fetch_library_page(server, key, 0, size)
+        progress = ProgressTracker(self.progress_channel, self.PROGRESS_INTERVAL)
+        done = len(records)
+        progress.update(stage='index', force=True, titles_total=total, titles_resolved=done)
+        yield records
+        if total <= size:
+            return
+        logged_pct = 0
+        with ThreadPoolExecutor(max_workers=self.INDEX_PAGE_WORKERS) as ex:
+            futures = [ex.submit(self._fetch_library_page, server, key, start, size) for start in range(size, total, size)]
+            for future in as_completed(futures):
+                records, _total = future.result()
+                done += len(records)
+                progress.update(stage='index', titles_resolved=len(records))
+                pct = done * 100 // total
+                if pct >= logged_pct + 25:
+                    logged_pct = pct
+                    logging.info(f"Indexing library '{library_name}': {done}/{total} items.")
+                yield records
+
+    @staticmethod
+    def _fetch_library_page(server, key: str, start: int, size: int):
+        """Fetch one container window of a section listing as ([(record, alt_titles)], total_size)."""
+        data = server.query(
+            f"{key}?includeGuids=1&X-Plex-Container-Start={start}&X-Plex-Container-Size={size}")
+        total = int(data.attrib.get('totalSize') or data.attrib.get('size') or 0)
+        records = [parsed for parsed in map(IndexedItem.from_element, data) if parsed is not None]
+        return records, total
+        
+    @abstractmethod
+    def create_plex_playlist(self, list_url, plex_playlist_name, library_name, callback=None, cancel=None):
+        pass
+
+    @abstractmethod
+    def _validate_list_url(self, list_url):
+        """Return an error message for an unusable list URL, else None."""
+
+    @abstractmethod
+    def _open_list(self, report, list_url):
+        """Start fetching the list; return (ListEntry iterable or None, info dict with 'name' / 'error')."""
+
+    def _after_match(self, library_name, results: list, report):
+        """Hook run on the match results before they are published (second-chance matching)."""
+
+    def _write_playlist(self, plex_playlist_name: str, records, report):
+        """Load the matched items and create the playlist on ``self.server``."""
+        return self._write_items(records, report,
+                                 lambda plex_items: self.server.createPlaylist(plex_playlist_name, items=plex_items))
+
+    def _write_items(self, records, report, write):
+        """Load the matched items, then hand them to ``write`` (create or append) unless cancelled."""
+        report.progress.update(stage='write', force=True)
+        with report.stage('plex_materialize'):
+            plex_items = self._materialize_items(records, report.cancel)
+        report.cancel.raise_if_cancelled()  # Last point at which a cancel leaves Plex untouched
+        with report.stage('plex_write'):
+            return write(plex_items)
+
+    # ---------------- Multi-server publishing -----------------
+    def mirror_playlist(self, list_url, plex_playlist_name, targets: dict, callback=None, cancel=None):
+        """Fetch ``list_url`` once and publish the playlist to several servers concurrently.
+
+        ``targets`` maps server names (as returned by `login_and_fetch_servers`)
+        to the library name, or list of names, to match on that server. Each
+        server gets a clone of this controller with its own connection; clones
+        share the library service, whose indexes are kept per server. The
+        callback receives the usual five arguments: the message summarizes
+        every server and the unmatched titles are those missing on any server.
+        Returns the list of `ServerOutcome`, which is also in the run report.
+        """
+        callback = callback or (lambda *a, **k: None)
+        report, callback = self._start_run_report(self.SOURCE, list_url, targets, callback, cancel)
+        outcomes = []
+        self._run_job(report, callback, plex_playlist_name,
+                      self._mirror_playlist, report, callback, list_url, plex_playlist_name, targets, outcomes)
+        return outcomes
+
+    def _mirror_playlist(self, report, callback, list_url, plex_playlist_name, targets, outcomes):
+        error = self._validate_list_url(list_url)
+        if error:
+            callback(False, error, [], plex_playlist_name, [])
+            return
+        clones = self._server_clones(list(targets), outcomes)
+        # Every server indexes its libraries while the list is fetched (once)
+        for name, clone in clones.items():
+            clone.prefetch_library_indexes(targets[name])
+        entries, info = self._open_list(report, list_url)
+        entries = list(entries) if entries is not None else []
+        report.count('list_entries', len(entries))
+        if not entries:
+            callback(False, info.get('error') or "No titles found in the list.", [], plex_playlist_name, [])
+            return
+        if not plex_playlist_name.strip():
+            plex_playlist_name = info['name']
+        # One shared tracker: every (title, server) pair is a unit of progress
+        report.progress.update(stage='match', force=True, titles_total=len(entries) * max(1, len(clones)))
+        if clones:
+            with ThreadPoolExecutor(max_workers=len(clones)) as ex:
+                futures = {ex.submit(clone._publish_entries, name, targets[name], entries, plex_playlist_name,
+                                     report.cancel, report.progress): name for name, clone in clones.items()}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        outcomes.append(future.result())
+                    except PlaylistCancelled:
+                        raise
+                    except Exception as e:
+                        logging.error(f"Publishing to Plex server '{name}' failed: {e}")
+                        outcomes.append(ServerOutcome(name, False, error=str(e)))
+        outcomes.sort(key=lambda o: list(targets).index(o.server) if o.server in targets else len(targets))
+        report.set(servers=[dict(o._replace(unmatched=len(o.unmatched))._asdict()) for o in outcomes])
+        # Export rows: titles missing on at least one server, in list order
+        missing = {id(entry): entry for o in outcomes for entry in o.unmatched}
+        match = MatchReport([(entry, None) for entry in missing.values()])
+        published = sum(1 for o in outcomes if o.success)
+        msg = " ".join([f"Published '{plex_playlist_name}' to {published}/{len(targets)} server(s)."] +
+                       [o.summary() + "." for o in outcomes])
+        failures = info.get('failures')
+        if failures:
+            msg += f" {len(failures)} failed to fetch."
+        if info.get('failed_pages'):
+            report.set(failed_pages=sorted(info['failed_pages']))
+            msg += f" {self._failed_pages_note(info['failed_pages'])}"
+        logging.info(msg)
+        callback(published > 0, msg, match.unmatched_titles, plex_playlist_name, match.unmatched_details())
+
+    @staticmethod
+    def _failed_pages_note(pages) -> str:
+        """User-facing note for list pages that could not be fetched."""
+        return f"List page(s) {', '.join(map(str, sorted(pages)))} failed; rerun to complete."
+
+    def _server_clones(self, server_names, outcomes) -> dict:
+        """Connect to the named servers concurrently; return {name: controller clone}.
+
+        The current connection is reused for its own server. Servers that
+        can't be reached are recorded in ``outcomes`` and left out.
+        """
+        current = getattr(self.server, 'friendlyName', None)
+
+        def connect(name):
+            if name == current:
+                return self.server
+            return self._connect_server(name)
+
+        clones = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(server_names))) as ex:
+            futures = {ex.submit(connect, name): name for name in server_names}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    server = future.result()
+                except Exception as e:
+                    logging.error(f"Failed to connect to Plex server '{name}': {e}")
+                    outcomes.append(ServerOutcome(name, False, error=f"connection failed: {e}"))
+                    continue
+                clone = copy.copy(self)  # Same knobs and shared service; own server connection
+                clone.server = server
+                clone.libraries = []
+                clones[name] = clone
+        return clones
+
+    def _publish_entries(self, server_name: str, library_name, entries, plex_playlist_name: str,
+                         cancel, progress=None) -> ServerOutcome:
+        """Match already-fetched ``entries`` on this controller's server and write the playlist there.
+
+        ``progress`` is the mirror job's tracker, so matching and writing on
+        every server show up in the job's progress display.
+        """
+        report = RunReport(self.SOURCE, server=server_name, library=library_name)
+        report.cancel = cancel
+        if progress is not None:
+            report.progress = progress
+        results = self.match_entries_streaming(library_name, iter(entries), report)
+        self._after_match(library_name, results, report)
+        match = MatchReport(results)
+        if match.matched_items:
+            self._write_playlist(plex_playlist_name, match.matched_items, report)
+            logging.info(f"Playlist '{plex_playlist_name}' written to '{server_name}': "
+                         f"matched={len(match.matched_items)} unmatched={len(match.unmatched)}")
+        return ServerOutcome(server_name, bool(match.matched_items), len(match.matched_items), match.unmatched,
+                             timings={k: round(v, 4) for k, v in report.timings.items()})
+
+    # ---------------- Dry run: match plans -----------------
+    def preview_playlist(self, list_url, plex_playlist_name, library_name, callback=None, cancel=None,
+                         plan=None) -> Optional['MatchPlan']:
+        """Fetch and match like `create_plex_playlist` but write nothing; return a `MatchPlan`.
+
+        Pass an earlier ``plan`` to match its entries against another library
+        without fetching the list again. ``callback`` receives the usual five
+        arguments with the plan summary as message; the plan (or None on
+        failure) is also returned for `commit_plan`.
+        """
+        callback = callback or (lambda *a, **k: None)
+        report, callback = self._start_run_report(self.SOURCE, list_url, library_name, callback, cancel)
+        report.set(mode='preview')
+        result = []
+        self._run_job(report, callback, plex_playlist_name,
+                      self._preview_playlist, report, callback, list_url, plex_playlist_name, library_name, plan,
+                      result)
+        return result[0] if result else None
+
+    def _preview_playlist(self, report, callback, list_url, plex_playlist_name, library_name, plan, result):
+        if plan is None:
+            error = self._validate_list_url(list_url)
+            if error:
+                callback(False, error, [], plex_playlist_name, [])
+                return
+        self.prefetch_library_indexes(library_name)
+        if plan is not None:
+            entries, info = plan.entries(), {'name': plan.playlist_name, 'failures': [None] * plan.fetch_failures}
+        else:
+            entries, info = self._open_list(report, list_url)
+        if entries is None:
+            callback(False, info['error'], [], plex_playlist_name, [])
+            return
+        report.match_methods = {}
+        results = self.match_entries_streaming(library_name, entries, report)
+        self._after_match(library_name, results, report)
+        if not results:
+            callback(False, info.get('error') or "No titles found in the list.", [], plex_playlist_name, [])
+            return
+        if not plex_playlist_name.strip():
+            plex_playlist_name = info['name']
+        new_plan = MatchPlan.from_results(self.SOURCE, list_url, getattr(self.server, 'machineIdentifier', None),
+                                          library_name, plex_playlist_name, results, report.match_methods,
+                                          len(info.get('failures') or ()))
+        result.append(new_plan)
+        logging.info(f"Preview ({self.SOURCE}): {new_plan.summary()}")
+        callback(bool(new_plan.matched), "Preview: " + new_plan.summary(), new_plan.unmatched_titles(),
+                 plex_playlist_name, new_plan.unmatched_details())
+
+    def commit_plan(self, plan: 'MatchPlan', plex_playlist_name=None, callback=None, cancel=None):
+        """Create the playlist from a reviewed `MatchPlan` (no list fetch, no matching).
+
+        ``plex_playlist_name`` overrides the plan's name. The plan must come
+        from the server this controller is connected to.
+        """
+        callback = callback or (lambda *a, **k: None)
+        name = (plex_playlist_name or '').strip() or plan.playlist_name
+        report, callback = self._start_run_report(plan.source, plan.list_url, plan.library, callback, cancel)
+        report.set(mode='commit')
+        self._run_job(report, callback, name, self._commit_plan, report, callback, plan, name)
+
+    def _commit_plan(self, report, callback, plan, plex_playlist_name):
+        if self.server is None or plan.server_id != getattr(self.server, 'machineIdentifier', None):
+            callback(False, "This preview was made for a different Plex server; preview again.",
+                     plan.unmatched_titles(), plex_playlist_name, plan.unmatched_details())
+            return
+        keys = plan.rating_keys()
+        if not keys:
+            callback(False, "None of the fetched items were found in the Plex library.",
+                     plan.unmatched_titles(), plex_playlist_name, plan.unmatched_details())
+            return
+        titles = {row['rating_key']: (row['plex_title'], row['plex_year']) for row in plan.matched}
+        records = [IndexedItem(key, *titles[key]) for key in keys]
+        self._write_playlist(plex_playlist_name, records, report)
+        unmatched_count = len(plan.unmatched)
+        logging.info(f"Playlist created from preview ({plan.source}): name='{plex_playlist_name}' "
+                     f"matched={len(keys)} unmatched={unmatched_count}")
+        msg = f"Created playlist '{plex_playlist_name}' with {len(keys)} matched items."
+        if unmatched_count:
+            msg += f" {unmatched_count} not found in Plex."
+        callback(True, msg, plan.unmatched_titles(), plex_playlist_name, plan.unmatched_details())
+
+    # ---------------- Rematch: previously unmatched titles only -----------------
+    def last_unmatched_run(self, plex_playlist_name=None, list_url=None) -> Optional[dict]:
+        """Latest successful run of this source in RUN_REPORT_PATH, if it left titles unmatched.
+
+        Optionally restricted to a playlist name and/or list URL. The record's
+        ``unmatched`` holds the missing entries (as exported to CSV) and
+        ``playlist_name`` the playlist they belong to. Previews are skipped.
+        """
+        if not self.RUN_REPORT_PATH or not os.path.exists(self.RUN_REPORT_PATH):
+            return None
+        with open(self.RUN_REPORT_PATH, encoding='utf-8') as f:
+            lines = f.readlines()
+        for line in reversed(lines):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if (record.get('source') == self.SOURCE and record.get('success') and record.get('mode') != 'preview'
+                    and (not plex_playlist_name or record.get('playlist_name') == plex_playlist_name)
+                    and (not list_url or record.get('list_url') == list_url)):
+                # The latest run decides: once everything matched there is nothing left to rematch
+                return record if record.get('unmatched') else None
+        return None
+
+    def rematch_playlist(self, entries, plex_playlist_name, library_name, callback=None, cancel=None, list_url=None):
+        """Match only previously unmatched ``entries`` and append new hits to an existing playlist.
+
+        ``entries`` are ListEntry records or their dicts, e.g. the ``unmatched``
+        of `last_unmatched_run` or the rows of `read_missing_csv`. The library
+        index is rebuilt first so newly added media is seen; the list itself is
+        not fetched. New items go to the end of the playlist and items it
+        already holds are skipped. Titles still missing are reported (and
+        recorded) as unmatched, so rematches can be repeated.
+        """
+        callback = callback or (lambda *a, **k: None)
+        entries = [e if isinstance(e, ListEntry) else ListEntry.from_dict(e) for e in entries]
+        report, callback = self._start_run_report(self.SOURCE, list_url, library_name, callback, cancel)
+        report.set(mode='rematch')
+        report.count('list_entries', len(entries))
+        self._run_job(report, callback, plex_playlist_name,
+                      self._rematch_playlist, report, callback, entries, plex_playlist_name, library_name)
+
+    def _rematch_playlist(self, report, callback, entries, plex_playlist_name, library_name):
+        titles, details = [e.title for e in entries], [e.to_dict() for e in entries]
+        if not entries:
+            callback(False, "There are no unmatched titles to rematch.", [], plex_playlist_name, [])
+            return
+        if self.server is None:
+            callback(False, "Not connected to a Plex server.", titles, plex_playlist_name, details)
+            return
+        try:
+            playlist = self.server.playlist(plex_playlist_name)
+        except Exception as e:
+            logging.error(f"Playlist '{plex_playlist_name}' not available for rematch: {e}")
+            callback(False, f"Playlist '{plex_playlist_name}' was not found on this server.", titles,
+                     plex_playlist_name, details)
+            return
+        # Drop the cached index and misses so media added since the last run is found
+        for name in self._library_names(library_name):
+            self.refresh_library_index(name)
+        results = self.match_entries_streaming(library_name, iter(entries), report)
+        self._after_match(library_name, results, report)
+        match = MatchReport(results)
+        with report.stage('plex_playlist_items'):
+            present = {item.ratingKey for item in playlist.items()}
+        new_items = [record for record in match.matched_items if record.ratingKey not in present]
+        report.count('added', len(new_items))
+        if new_items:
+            self._write_items(new_items, report, playlist.addItems)
+        logging.info(f"Rematch ({self.SOURCE}): playlist='{plex_playlist_name}' requested={len(entries)} "
+                     f"added={len(new_items)} still_missing={len(match.unmatched)}")
+        msg = (f"Added {len(new_items)} newly matched item(s) to '{plex_playlist_name}'." if new_items else
+               f"No new matches for '{plex_playlist_name}'.")
+        if match.unmatched:
+            msg += f" {len(match.unmatched)} of {len(entries)} still not found in Plex."
+        callback(True, msg, match.unmatched_titles, plex_playlist_name, match.unmatched_details())
+
+    def _run_job(self, report, callback, plex_playlist_name, job, *args):
+        """Run a playlist job, reporting a cancellation through ``callback`` like any other failure."""
+        try:
+            job(*args)
+        except PlaylistCancelled:
+            logging.info(f"Playlist creation cancelled ({report.source}).")
+            report.set(cancelled=True)
+            callback(False, "Playlist creation cancelled.", [], plex_playlist_name, [])
+
+    @staticmethod
+    def _sleep(seconds: float, cancel=None):
+        """Sleep that wakes up (raising PlaylistCancelled) when ``cancel`` fires."""
+        if cancel is not None:
+            cancel.sleep(seconds)
+        else:
+            time.sleep(seconds)
+    
+    def _match_title(self, raw_title: str, index: dict, library, report=None, year=None,
+                     stages=('exact', 'fuzzy', 'search')):
+        """Resolve one requested title against the library index.
+
+        Tries, in order: exact canonical form (year-qualified first when a year
+        is known), fuzzy (see `FUZZY_SCORER`) and finally a direct Plex search; ``stages``
+        limits which steps run. Returns (item_or_None, method, score) where
+        method is one of 'exact', 'fuzzy', 'search' or None and score is the
+        similarity that accepted a fuzzy match (1.0 for the other methods).
+        Time spent in each step is added to ``report`` when provided.
+        """
+        report = report or RunReport('adhoc')
+        wanted_forms = self._canonical_forms(raw_title)
+        steps = (('exact', self._match_exact, index), ('fuzzy', self._match_fuzzy, index),
+                 ('search', self._match_search, library))
+        for method, step, source in steps:
+            if method not in stages or (method == 'fuzzy' and not index):
+                continue
+            t0 = time.perf_counter()
+            chosen = step(raw_title, wanted_forms, source, year)
+            report.add_time(f'match_{method}', time.perf_counter() - t0)
+            score = 1.0
+            if method == 'fuzzy':
+                chosen, score = chosen
+            if chosen:
+                return chosen, method, score
+        return None, None, None
+
+    def _match_exact(self, raw_title, wanted_forms, index, year=None):
+        keys = [f"{form}|{year}" for form in wanted_forms] if year else []
+        keys.extend(wanted_forms)
+        for key in keys:
+            if key in index:
+                return self._pick_candidate(index[key], key, raw_title, year)
+        return None
+
+    def _match_fuzzy(self, raw_title, wanted_forms, index, year=None):
+        """(item_or_None, best_ratio): the ratio is what the match was accepted on."""
+        target = next(iter(wanted_forms)) if wanted_forms else ''
+        scorer = self._fuzzy_scorer()
+        forms, by_letter = self._fuzzy_candidates(index)
+        best_form, best_ratio = _fuzzy_best_form(target, forms, scorer.name, self._fuzzy_threshold(), by_letter)
+        return self._accept_fuzzy(raw_title, index, best_form, best_ratio, year), best_ratio
+
+    @staticmethod
+    def _fuzzy_candidates(index: dict):
+        """(plain forms, forms by first letter) of ``index``; precomputed for built indexes."""
+        if isinstance(index, LibraryIndex) and index.plain_forms is not None:
+            return index.plain_forms, index.forms_by_letter
+        forms = tuple(c for c in index if '|' not in c)
+        return forms, _bucket_forms(forms)
+
+    def _fuzzy_scorer(self) -> SimilarityScorer:
+        return get_scorer(self.FUZZY_SCORER)
+
+    def _fuzzy_threshold(self) -> float:
+        if self.FUZZY_THRESHOLD is not None:
+            return self.FUZZY_THRESHOLD
+        return self._fuzzy_scorer().threshold
+
+    def _accept_fuzzy(self, raw_title, index, best_form, best_ratio, year=None):
+        if best_form and best_ratio >= self._fuzzy_threshold():
+            chosen = self._pick_candidate(index[best_form], best_form, raw_title, year)
+            logging.debug(f"Fuzzy matched '{raw_title}' -> '{chosen.title}' ({best_ratio:.2f}).")
+            return chosen
+        return None
+
+    def _match_search(self, raw_title, wanted_forms, library, year=None):
+        """Legacy direct Plex search fallback."""
         try:
-            for item in library.all():
-                for form in self._canonical_forms(item.title):
-                    idx.setdefault(form, []).append(item)
-            self._title_index[library_name] = idx
-            logging.info(f"Indexed {len(idx)} canonical forms for library '{library_name}'.")
-        except Exception as e:
-            logging.error(f"Failed to build index for library '{library_name}': {e}")
-            self._title_index[library_name] = {}
-        
-    @abstractmethod
-    def create_plex_playlist(self, list_url, plex_playlist_name, library_name, callback=None):
-        pass
-    
+            # Several jobs / servers' clones may search the same title at once
+            key = ('plex-search', getattr(self.server, 'machineIdentifier', None), getattr(library, 'key', None), raw_title)
+            plex_res = self.service.single_flight(key, lambda: library.search(title=raw_title))
+            hits = [IndexedItem.from_plex(item) for item in plex_res
+                    if item.title.lower() == raw_title.lower() or (self._canonical_forms(item.title) & wanted_forms)]
+            if hits:
+                return self._pick_candidate(hits, next(iter(wanted_forms), ''), raw_title, year)
+        except Exception:
+            pass
+        return None
+
+    def _fuzzy_best_forms_bulk(self, index: dict, targets: Sequence[str], cancel=None):
+        """Best (target, form, ratio) for many target forms, sharded across processes.
+
+        The canonical-form set is shipped to each worker once (pool
+        initializer); targets are split into a few shards per worker. Small
+        batches, a single core or a broken pool fall back to in-process scoring.
+        On cancel, queued shards are dropped and the pool is shut down without waiting.
+        """
+        cancel = cancel or CancellationToken()
+        forms, by_letter = self._fuzzy_candidates(index)
+        scorer, cutoff = self._fuzzy_scorer().name, self._fuzzy_threshold()
+        workers = self.FUZZY_WORKERS or os.cpu_count() or 1
+        if workers > 1 and len(targets) >= self.FUZZY_POOL_MIN_TITLES:
+            shard = max(1, -(-len(targets) // (workers * 4)))
+            shards = [list(targets[i:i + shard]) for i in range(0, len(targets), shard)]
+            pool, futures = None, []
+            try:
+                pool = ProcessPoolExecutor(max_workers=workers, initializer=_fuzzy_pool_init,
+                                           initargs=(forms, scorer, cutoff))
+                futures = [pool.submit(_fuzzy_pool_match, part) for part in shards]
+                return [res for future in futures for res in cancel.wait_for(future)]
+            except PlaylistCancelled:
+                for future in futures:
+                    future.cancel()
+                raise
+            except Exception as e:
+                logging.warning(f"Fuzzy process pool unavailable ({e}); scoring in-process.")
+            finally:
+                if pool is not None:
+                    pool.shutdown(wait=not cancel.cancelled)
+        results = []
+        for t in targets:
+            cancel.raise_if_cancelled()
+            results.append((t, *_fuzzy_best_form(t, forms, scorer, cutoff, by_letter)))
+        return results
+
+    def _match_title_cached(self, library_name: str, raw_title: str, index: dict, library, report=None, year=None,
+                            stages=('exact', 'fuzzy', 'search')):
+        """`_match_title` backed by the shared match cache.
+
+        Only hits are cached: a miss runs again next time, so the live
+        ``library.search`` fallback still finds media added since the index
+        was built. Entries are dropped together with the library index by
+        `refresh_library_index`.
+        """
+        key = self._index_key(library_name) + (raw_title, year)
+        with self.service.lock:
+            cached = self.service.match_cache.get(key)
+        if cached is not None:
+            if report is not None:
+                report.count('match_cache_hits')
+            return cached
+        result = self._match_title(raw_title, index, library, report, year, stages)
+        if result[0] is not None:
+            self._cache_match(library_name, raw_title, year, result)
+        return result
+
+    def _cache_match(self, library_name: str, raw_title: str, year, result):
+        with self.service.lock:
+            self.service.match_cache[self._index_key(library_name) + (raw_title, year)] = result
+
+    def _materialize_items(self, records, cancel=None) -> List[object]:
+        """Fetch full plexapi objects for matched index records, preserving order.
+
+        Uses one batched ``/library/metadata/<k1>,<k2>,...`` request per
+        MATERIALIZE_BATCH keys instead of keeping Plex objects in the index.
+        """
+        keys = [r.ratingKey for r in records]
+        by_key = {}
+        for i in range(0, len(keys), self.MATERIALIZE_BATCH):
+            if cancel is not None:
+                cancel.raise_if_cancelled()
+            chunk = keys[i:i + self.MATERIALIZE_BATCH]
+            for item in self.server.fetchItems('/library/metadata/' + ','.join(str(k) for k in chunk)):
+                by_key[int(item.ratingKey)] = item
+        missing = len(keys) - sum(1 for k in keys if k in by_key)
+        if missing:
+            logging.warning(f"{missing} matched item(s) could not be loaded from Plex (removed since indexing?).")
+        return [by_key[k] for k in keys if k in by_key]
+
     def find_matched_items(self, library_name, list_items):
         if self.server is None:
             logging.warning("Server connection is not established.")
@@ -113,113 +1677,266 @@ class PlexBaseApp(ABC):
 
         # Build index if not present
         self._ensure_library_index(library_name, library)
-        index = self._title_index.get(library_name, {})
+        index = self._get_library_index(library_name)
         results = []
         seen = set()
         for raw_title in list_items:
             if not raw_title:
                 continue
-            wanted_forms = self._canonical_forms(raw_title)
-            chosen = None
-            # 1. Exact canonical form
-            for form in wanted_forms:
-                if form in index:
-                    chosen = index[form][0]
-                    break
-            # 2. Fuzzy match if not found
-            if not chosen and index:
-                target = next(iter(wanted_forms)) if wanted_forms else ''
-                candidates = index.keys()
-                if target and target[0].isalpha():
-                    subset = [c for c in candidates if c.startswith(target[0])]
-                    if subset:
-                        candidates = subset
-                best_form = None
-                best_ratio = 0.0
-                for cand in candidates:
-                    r = difflib.SequenceMatcher(None, target, cand).ratio()
-                    if r > best_ratio:
-                        best_ratio = r
-                        best_form = cand
-                if best_form and best_ratio >= self.FUZZY_THRESHOLD:
-                    chosen = index[best_form][0]
-                    logging.debug(f"Fuzzy matched '{raw_title}' -> '{chosen.title}' ({best_ratio:.2f}).")
-            # 3. Legacy direct Plex search fallback
-            if not chosen:
-                try:
-                    plex_res = library.search(title=raw_title)
-                    for item in plex_res:
-                        if item.title.lower() == raw_title.lower() or (self._canonical_forms(item.title) & wanted_forms):
-                            chosen = item
-                            break
-                except Exception:
-                    pass
+            chosen, _method, _score = self._match_title_cached(library_name, raw_title, index, library)
             if chosen and chosen.ratingKey not in seen:
                 seen.add(chosen.ratingKey)
                 results.append(chosen)
-        return results
+        return self._materialize_items(results)
 
-    def match_titles_with_status(self, library_name: str, list_items: Sequence[str]):
-        """Return list of (raw_title, matched_item_or_None) preserving order.
+    def _prepare_library(self, library_name: str, report=None):
+        """Resolve the library section and make sure its index is built.
 
-        This provides visibility into which requested titles were not found so the
-        GUI can export them. Uses same matching logic as `find_matched_items` but
-        does not deduplicate input titles (except that Plex items themselves are
-        reused) and preserves ordering of the provided list.
+        Returns (library, index) or (None, {}) when the library is unavailable.
         """
+        report = report or RunReport('adhoc')
         if self.server is None:
             logging.warning("Server connection is not established.")
-            return []
+            return None, {}
         try:
             library = self.server.library.section(library_name)
         except Exception as e:
             logging.error(f"Unable to access library '{library_name}': {e}")
+            return None, {}
+        with self.service.lock:
+            report.set(index_cached=self._index_key(library_name) in self.service.indexes)
+        with report.stage('library_index'):
+            self._ensure_library_index(library_name, library, report.cancel)
+        index = self._get_library_index(library_name)
+        report.set(index_forms=len(index))
+        return library, index
+
+    def match_titles_with_status(self, library_name: str, list_items: Sequence[str], report=None):
+        """Return list of (raw_title, IndexedItem_or_None) preserving order.
+
+        This provides visibility into which requested titles were not found so the
+        GUI can export them. Uses same matching logic as `find_matched_items` but
+        does not deduplicate input titles (except that Plex items themselves are
+        reused) and preserves ordering of the provided list. Match counts per
+        method are recorded on ``report`` when provided.
+        """
+        report = report or RunReport('adhoc')
+        library, index = self._prepare_library(library_name, report)
+        if library is None:
             return []
-        self._ensure_library_index(library_name, library)
-        index = self._title_index.get(library_name, {})
         pairs = []
-        for raw_title in list_items:
-            if not raw_title:
-                pairs.append((raw_title, None))
+        with report.stage('match'):
+            for raw_title in list_items:
+                report.cancel.raise_if_cancelled()
+                if not raw_title:
+                    pairs.append((raw_title, None))
+                    report.count('unmatched')
+                    continue
+                chosen, method, _score = self._match_title_cached(library_name, raw_title, index, library, report)
+                report.count(f'matched_{method}' if method else 'unmatched')
+                pairs.append((raw_title, chosen))
+        return pairs
+
+    def match_entries_streaming(self, library_name: str, entries: Iterable['ListEntry'], report=None):
+        """Match ListEntry records as they arrive from ``entries``.
+
+        Entries with a known IMDb / TMDB ID are looked up by Plex GUID first;
+        the rest (and GUID misses) go through title matching.
+
+        ``entries`` is typically a generator fed by a background fetcher (see
+        `_stream_from_producer`), so matching overlaps with network waits.
+        Returns list of (entry, IndexedItem_or_None) in arrival order; callers
+        re-sort by ``position`` when list order matters. If the library is
+        unavailable the iterable is still drained so the producer can finish.
+        ``library_name`` may also be a sequence of names (see `_match_entries_multi`).
+        """
+        report = report or RunReport('adhoc')
+        if not isinstance(library_name, str):
+            names = self._library_names(library_name)
+            if len(names) > 1:
+                return self._match_entries_multi(names, entries, report)
+            library_name = names[0]
+        library, index = self._prepare_library(library_name, report)
+        # With the process pool enabled, fuzzy work is deferred and done in one sharded pass
+        defer_fuzzy = self.FUZZY_PROCESS_POOL and bool(index)
+        stages = ('exact',) if defer_fuzzy else ('exact', 'fuzzy', 'search')
+        results = []
+        deferred = []  # positions in results still needing fuzzy / search
+        for entry in entries:
+            report.cancel.raise_if_cancelled()
+            if library is None:
+                results.append((entry, None))
                 continue
-            wanted_forms = self._canonical_forms(raw_title)
-            chosen = None
-            # Exact canonical form
-            for form in wanted_forms:
-                if form in index:
-                    chosen = index[form][0]
-                    break
-            # Fuzzy
-            if not chosen and index:
-                target = next(iter(wanted_forms)) if wanted_forms else ''
-                candidates = index.keys()
-                if target and target[0].isalpha():
-                    subset = [c for c in candidates if c.startswith(target[0])]
-                    if subset:
-                        candidates = subset
-                best_form = None
-                best_ratio = 0.0
-                for cand in candidates:
-                    r = difflib.SequenceMatcher(None, target, cand).ratio()
-                    if r > best_ratio:
-                        best_ratio = r
-                        best_form = cand
-                if best_form and best_ratio >= self.FUZZY_THRESHOLD:
-                    chosen = index[best_form][0]
-            # Legacy search fallback
+            start = time.perf_counter()
+            chosen = self._match_ids(entry, index) if index else None
+            if chosen:
+                method, score = 'guid', 1.0
+            else:
+                chosen, method, score = self._match_title_cached(library_name, entry.title, index, library, report,
+                                                                 entry.year, stages)
+            report.add_time('match', time.perf_counter() - start)
+            results.append((entry, chosen))
+            if not chosen and defer_fuzzy:
+                deferred.append(len(results) - 1)
+                continue
+            self._record_match_outcome(report, method, entry, score)
+        if deferred:
+            self._resolve_deferred_fuzzy(library_name, index, library, results, deferred, report)
+        return results
+
+    def _match_entries_multi(self, library_names: List[str], entries: Iterable['ListEntry'], report):
+        """`match_entries_streaming` across several libraries of the connected server.
+
+        All indexes are built concurrently. Each entry goes through the usual
+        stages (GUID, exact, fuzzy, search) and every stage is tried on each
+        library in preference order before falling to the next, weaker stage:
+        a GUID hit in any library beats a fuzzy hit in the preferred one. The
+        fuzzy stage always runs inline here (FUZZY_PROCESS_POOL is per library).
+        """
+        self.prefetch_library_indexes(library_names)
+        targets = []
+        for name in library_names:
+            library, index = self._prepare_library(name, report)
+            if library is not None:
+                targets.append((name, library, index))
+        report.set(libraries=[name for name, _library, _index in targets],
+                   index_forms=sum(len(index) for _name, _library, index in targets))
+        results = []
+        for entry in entries:
+            report.cancel.raise_if_cancelled()
+            start = time.perf_counter()
+            chosen, method, score, found_in = self._match_entry_multi(entry, targets, report)
+            report.add_time('match', time.perf_counter() - start)
+            results.append((entry, chosen))
+            if found_in:
+                report.count(f'matched_in:{found_in}')
+            self._record_match_outcome(report, method, entry, score)
+        return results
+
+    def _match_entry_multi(self, entry, targets, report):
+        """Return (IndexedItem, method, score, library_name) for ``entry`` or (None, None, None, None)."""
+        for name, _library, index in targets:
+            chosen = self._match_ids(entry, index) if index else None
+            if chosen:
+                return chosen, 'guid', 1.0, name
+        for stage in ('exact', 'fuzzy', 'search'):
+            for name, library, index in targets:
+                chosen, method, score = self._match_title_cached(name, entry.title, index, library, report,
+                                                                 entry.year, (stage,))
+                # A cached hit from another stage only counts in that stage's pass, or a fuzzy / search
+                # hit here could beat an exact match in a later library
+                if chosen and method == stage:
+                    return chosen, method, score, name
+        return None, None, None, None
+
+    def _record_match_outcome(self, report, method, entry=None, score=None):
+        report.count(f'matched_{method}' if method else 'unmatched')
+        if report.match_methods is not None and method and entry is not None:
+            report.match_methods[id(entry)] = (method, score)
+        report.mark('first_match_s')
+        if method:
+            report.progress.update(stage='match', matched=1)
+        else:
+            report.progress.update(stage='match', unmatched=1)
+
+    def _resolve_deferred_fuzzy(self, library_name, index, library, results, deferred, report):
+        """Finish entries that missed the exact step: bulk fuzzy pass, then per-title search."""
+        targets = []
+        for pos in deferred:
+            forms = self._canonical_forms(results[pos][0].title)
+            targets.append(next(iter(forms)) if forms else '')
+        with report.stage('match_fuzzy'):
+            scored = self._fuzzy_best_forms_bulk(index, targets, report.cancel)
+        report.count('fuzzy_pool_titles', len(targets))
+        for pos, (_target, best_form, ratio) in zip(deferred, scored):
+            report.cancel.raise_if_cancelled()
+            entry = results[pos][0]
+            chosen = self._accept_fuzzy(entry.title, index, best_form, ratio, entry.year)
+            method, score = ('fuzzy', ratio) if chosen else (None, None)
             if not chosen:
-                try:
-                    plex_res = library.search(title=raw_title)
-                    for item in plex_res:
-                        if item.title.lower() == raw_title.lower() or (self._canonical_forms(item.title) & wanted_forms):
-                            chosen = item
-                            break
-                except Exception:
-                    pass
-            pairs.append((raw_title, chosen))
-        return pairs
-    
+                chosen, method, score = self._match_title(entry.title, index, library, report, entry.year,
+                                                          ('search',))
+            if chosen:
+                self._cache_match(library_name, entry.title, entry.year, (chosen, method, score))
+            results[pos] = (entry, chosen)
+            self._record_match_outcome(report, method, entry, score)
+
+    @staticmethod
+    def _stream_from_producer(producer, cancel=None):
+        """Run ``producer(emit)`` on a background thread and yield emitted values as they arrive.
+
+        Exceptions raised by the producer are re-raised in the consuming thread
+        once everything emitted before the failure has been yielded. With a
+        ``cancel`` token the consumer stops waiting as soon as it fires (the
+        producer is expected to notice the same token and wind down).
+        """
+        out = Queue()
+        done = object()
+        failure = []
+
+        def run():
+            try:
+                producer(out.put)
+            except Exception as e:
+                failure.append(e)
+            finally:
+                out.put(done)
+
+        Thread(target=run, daemon=True).start()
+        while True:
+            try:
+                value = out.get(timeout=CancellationToken.POLL if cancel is not None else None)
+            except Empty:
+                cancel.raise_if_cancelled()
+                continue
+            if value is done:
+                break
+            yield value
+        if failure:
+            raise failure[0]
+
+    # ---------------- Run reports -----------------
+    def _start_run_report(self, source: str, list_url: str, library_name: str, callback, cancel=None):
+        """Create a RunReport for this job and wrap ``callback`` so the report is
+        finalized and written exactly when the job reports its outcome."""
+        report = RunReport(source, list_url=list_url, library=library_name)
+        report.progress = ProgressTracker(self.progress_channel, self.PROGRESS_INTERVAL)
+        if cancel is not None:
+            report.cancel = cancel
+
+        def reporting_callback(success, message, *args):
+            report.progress.update(stage='done', force=True)
+            report.set(success=bool(success), message=message)
+            if len(args) >= 2:
+                report.set(playlist_name=args[1])
+            if len(args) >= 3 and args[2]:
+                report.set(unmatched=args[2])  # Export rows; what a later rematch starts from
+            self._write_run_report(report)
+            callback(success, message, *args)
+        return report, reporting_callback
+
+    def _write_run_report(self, report: 'RunReport'):
+        """Append the report as one JSON line and push it to the optional metrics hook."""
+        record = report.to_dict()
+        if self.RUN_REPORT_PATH:
+            try:
+                with open(self.RUN_REPORT_PATH, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record) + "\n")
+            except OSError as e:
+                logging.warning(f"Could not write run report to '{self.RUN_REPORT_PATH}': {e}")
+        if self.metrics_hook:
+            try:
+                self.metrics_hook(record)
+            except Exception as e:
+                logging.warning(f"Metrics hook raised: {e}")
+        logging.info(
+            "Run timings (%s): wall=%.2fs %s" % (
+                report.source, record['wall_s'],
+                ' '.join(f"{k}={v:.2f}s" for k, v in record['timings_s'].items()))
+        )
+
     def login_and_fetch_servers(self, update_ui_callback):
+        from plexapi.myplex import MyPlexPinLogin, MyPlexAccount
         headers = {'X-Plex-Client-Identifier': 'unique_client_identifier'}
         pinlogin = MyPlexPinLogin(headers=headers, oauth=True)
         oauth_url = pinlogin.oauthUrl()
@@ -233,11 +1950,13 @@ class PlexBaseApp(ABC):
             if servers:
                 # Store account for subsequent server selection
                 self.plex_account = plex_account
+                self._persist_session(servers=servers)
                 # Auto-connect only if there is a single server; otherwise wait for user selection
                 if len(servers) == 1:
                     try:
                         self.server = plex_account.resource(servers[0]).connect()
                         self.fetch_and_store_libraries()
+                        self._persist_session()
                     except Exception as e:
                         logging.error(f"Failed to auto-connect to Plex server '{servers[0]}': {e}")
                         update_ui_callback(servers=servers, success=False)
@@ -250,17 +1969,127 @@ class PlexBaseApp(ABC):
             # Failed to log in, call the callback with success=False
             update_ui_callback(servers=None, success=False)
 
+    def _persist_session(self, servers=None):
+        """Save the account token, server list and the connected server's URI / libraries."""
+        store = self.session_store
+        if store is None or self.plex_account is None:
+            return
+        fields = {'token': getattr(self.plex_account, 'authenticationToken', None), 'servers': servers}
+        if self.server is not None:
+            fields.update(server=self.server.friendlyName, uri=self.server._baseurl, libraries=self.libraries)
+        store.save(**fields)
+
+    def resume_session(self, update_ui_callback) -> bool:
+        """Start from the persisted session instead of the OAuth browser flow.
+
+        Connects straight to the last used server URI with the stored token and
+        takes its libraries from the cache, reports the cached server list, then
+        revalidates account, servers and libraries on a background thread.
+        Returns False (nothing done) when no session is stored; the caller then
+        falls back to `login_and_fetch_servers`. The callback's ``server`` names
+        the server that is connected, so the UI can select it.
+        """
+        store = self.session_store
+        state = store.load() if store is not None else {}
+        token = state.get('token')
+        if not token:
+            return False
+        from plexapi.server import PlexServer
+        server_name = state.get('server')
+        uri = state.get('connections', {}).get(server_name)
+        if uri:
+            try:
+                self.server = PlexServer(uri, token, timeout=self.SESSION_CONNECT_TIMEOUT)
+                self.libraries = state.get('libraries', {}).get(server_name) or []
+                if not self.libraries:
+                    self.fetch_and_store_libraries()
+                logging.info(f"Resumed Plex session on '{server_name}'.")
+            except Exception as e:
+                logging.info(f"Cached connection to '{server_name}' failed ({e}); revalidating.")
+                self.server = None
+        update_ui_callback(servers=state.get('servers') or ([server_name] if server_name else []), success=True,
+                           server=server_name if self.server is not None else None)
+        Thread(target=self._revalidate_session, args=(token, state, update_ui_callback),
+               name="session-revalidate", daemon=True).start()
+        return True
+
+    def _revalidate_session(self, token: str, cached: dict, update_ui_callback):
+        """Background check of a resumed session; the UI is only updated when something changed."""
+        from plexapi.exceptions import Unauthorized
+        from plexapi.myplex import MyPlexAccount
+        try:
+            account = MyPlexAccount(token=token)
+            resources = [r for r in account.resources() if r.owned and r.connections and r.provides == 'server']
+        except Unauthorized:
+            logging.warning("Stored Plex sign-in is no longer valid; please sign in again.")
+            self.session_store.clear()
+            self.server = None
+            update_ui_callback(servers=None, success=False, expired=True)
+            return
+        except Exception as e:
+            logging.info(f"Could not revalidate the Plex session (offline?): {e}; using cached data.")
+            return
+        self.plex_account = account
+        servers = [r.name for r in resources]
+        changed = servers != cached.get('servers')
+        try:
+            if self.server is None and cached.get('server') in servers:
+                self.server = account.resource(cached['server']).connect()
+                changed = True
+            if self.server is not None:
+                before = self.libraries
+                self.fetch_and_store_libraries()
+                changed = changed or self.libraries != before
+        except Exception as e:
+            logging.warning(f"Revalidating the Plex server connection failed: {e}")
+        self._persist_session(servers=servers)
+        if changed:
+            update_ui_callback(servers=servers, success=True, revalidated=True,
+                               server=cached.get('server') if self.server is not None else None)
+
+    def _account(self):
+        """The signed-in MyPlexAccount, or None.
+
+        After `resume_session` the account is only set once the background
+        revalidation succeeds; until then (or all session when plex.tv is
+        unreachable) it is built from the stored token on first use here.
+        """
+        if self.plex_account is None and self.session_store is not None:
+            token = self.session_store.load().get('token')
+            if token:
+                from plexapi.myplex import MyPlexAccount
+                try:
+                    self.plex_account = MyPlexAccount(token=token)
+                except Exception as e:
+                    logging.info(f"Could not reach the Plex account with the stored sign-in: {e}")
+        return self.plex_account
+
+    def _connect_server(self, server_name: str):
+        """Return a PlexServer connection to ``server_name``.
+
+        Goes through the account's resources; without a reachable account
+        (offline after a resume) the server's last known URI is used with the
+        stored token.
+        """
+        account = self._account()
+        if account is not None:
+            return account.resource(server_name).connect()
+        state = self.session_store.load() if self.session_store is not None else {}
+        uri = state.get('connections', {}).get(server_name)
+        if not (state.get('token') and uri):
+            raise RuntimeError("Plex account unavailable and no cached address for this server")
+        from plexapi.server import PlexServer
+        return PlexServer(uri, state['token'], timeout=self.SESSION_CONNECT_TIMEOUT)
+
     def connect_to_server(self, server_name: str):
         """Connect to the specified Plex server name and refresh libraries.
 
         Returns True on success, False on failure.
         """
-        if not self.plex_account:
-            logging.error("Cannot connect to server; Plex account not authenticated.")
-            return False
         try:
-            self.server = self.plex_account.resource(server_name).connect()
+            self.server = self._connect_server(server_name)
             self.fetch_and_store_libraries()
+            self._persist_session()
             logging.info(f"Connected to Plex server '{server_name}' and loaded libraries.")
             return True
         except Exception as e:
@@ -276,38 +2105,87 @@ class PlexBaseApp(ABC):
             self.libraries = [{'name': library.title, 'type': library.type, 'uuid': library.uuid} for library in libraries]
  
 class PlexIMDbApp(PlexBaseApp):
-    def __init__(self, server=None):
-        super().__init__(server=server)
+    SOURCE = 'imdb'
+
+    def __init__(self, server=None, service=None):
+        super().__init__(server=server, service=service)
         # Batch / performance tuning knobs
         self.LARGE_LIST_THRESHOLD = 500   # Threshold to enable incremental batch logging
         self.BATCH_MATCH_SIZE = 100       # Matching batch size for large lists
         
-    def fetch_item_details(self, queue, ia, imdb_id, retry_count=3, delay=1):
+    def fetch_item_details(self, queue, ia, imdb_id, retry_count=3, delay=1, cancel=None):
+        """Put (imdb_id, title, year) on ``queue`` once the title is known; concurrent jobs share one lookup."""
+        try:
+            found = self.service.single_flight(
+                ('imdb-title', imdb_id), lambda: self._fetch_imdb_title(ia, imdb_id, retry_count, delay, cancel), cancel)
+        except PlaylistCancelled:
+            return
+        if found:
+            queue.put((imdb_id, *found))
+
+    def _fetch_imdb_title(self, ia, imdb_id, retry_count, delay, cancel=None):
+        """Return (title, year) for ``imdb_id`` or None; raises PlaylistCancelled when ``cancel`` fires."""
+        from imdb import IMDbDataAccessError
         attempts = 0
         while attempts < retry_count:
+            if cancel is not None:
+                cancel.raise_if_cancelled()
             try:
                 movie = ia.get_movie(imdb_id[2:])  # Remove 'tt' prefix (works with movies/tv shows)
                 title = movie.get('title')
-                if title:
-                    queue.put((imdb_id, title))
-                    return
+                return (title, movie.get('year')) if title else None
             except IMDbDataAccessError as e:
                 print(f"Error fetching {imdb_id}: {e}. Attempt {attempts + 1} of {retry_count}")
-                time.sleep(delay * (attempts + 1))  # Exponential back-off
+                self._sleep(delay * (attempts + 1), cancel)  # Exponential back-off
                 attempts += 1
             except Exception as e:
                 print(f"Unexpected error fetching {imdb_id}: {e}")
-                return
+                return None
         print(f"Failed to fetch details for {imdb_id} after {retry_count} attempts.")
+        return None
         
-    def fetch_imdb_list_data(self, imdb_list_url):
+    @staticmethod
+    def _parse_lister_year(div):
+        """Year from a lister item's year span, e.g. "(1999)", "(I) (2010)" or "(2005– )"."""
+        span = div.find('span', class_=re.compile(r'lister-item-year'))
+        m = re.search(r'(\d{4})', span.get_text()) if span else None
+        return int(m.group(1)) if m else None
+
+    def _produce_imdb_entries(self, imdb_ids, emit, report):
+        """Fetch titles per IMDb ID (one thread each) and emit (imdb_id, title, year) as each resolves."""
+        import imdb
+        ia = imdb.Cinemagoer()
+
+        def put(pair):
+            report.count('titles_resolved')
+            report.progress.update(stage='resolve', titles_resolved=1)
+            emit(pair)
+        sink = SimpleNamespace(put=put)  # fetch_item_details reports results via .put()
+        threads = []
+        with report.stage('title_resolve'):
+            for imdb_id in imdb_ids:
+                report.cancel.raise_if_cancelled()
+                thread = Thread(target=self.fetch_item_details, args=(sink, ia, imdb_id),
+                                kwargs={'cancel': report.cancel}, daemon=True)
+                threads.append(thread)
+                thread.start()
+            for thread in threads:
+                # Cancelled fetch threads finish their current request in the background
+                while thread.is_alive():
+                    report.cancel.raise_if_cancelled()
+                    thread.join(CancellationToken.POLL)
+
+    def fetch_imdb_list_data(self, imdb_list_url, report=None):
+        from bs4 import BeautifulSoup
+        report = report or RunReport('adhoc')
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
         
         try:
-            response = requests.get(imdb_list_url, headers=headers, timeout=10)
-            response.raise_for_status()
+            with report.stage('list_fetch'):
+                response = self.service.session('imdb').get(imdb_list_url, headers=headers, timeout=10)
+                response.raise_for_status()
         except requests.exceptions.HTTPError:
             return [], None, "HTTP error occurred. Please check the URL.", []
         except requests.exceptions.ConnectionError:
@@ -317,139 +2195,101 @@ class PlexIMDbApp(PlexBaseApp):
         except requests.exceptions.RequestException:
             return [], None, "An error occurred. Please try again.", []
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-        # Attempt to extract a list title from typical IMDb list structures
-        list_title = None
-        h1 = soup.find('h1')
-        if h1 and h1.text.strip():
-            list_title = h1.text.strip()
-        if not list_title:
-            og_title_tag = soup.find('meta', property='og:title')
-            if og_title_tag and og_title_tag.get('content'):
-                list_title = og_title_tag['content'].strip()
-        if not list_title:
-            slug = imdb_list_url.rstrip('/').split('/')[-1]
-            if slug:
-                list_title = slug.replace('-', ' ').title()
+        with report.stage('list_parse'):
+            soup = BeautifulSoup(response.text, 'html.parser')
+            # Attempt to extract a list title from typical IMDb list structures
+            list_title = None
+            h1 = soup.find('h1')
+            if h1 and h1.text.strip():
+                list_title = h1.text.strip()
+            if not list_title:
+                og_title_tag = soup.find('meta', property='og:title')
+                if og_title_tag and og_title_tag.get('content'):
+                    list_title = og_title_tag['content'].strip()
+            if not list_title:
+                slug = imdb_list_url.rstrip('/').split('/')[-1]
+                if slug:
+                    list_title = slug.replace('-', ' ').title()
         
-        imdb_ids = []
-        id_title_pairs = []  # (imdb_id, title)
-
-        # Primary structured parse: div.lister-item
-        lister_items = soup.find_all('div', class_=re.compile(r'lister-item.*'))
-        if lister_items:
-            for div in lister_items:
-                a = div.find('a', href=True)
-                if not a:
-                    continue
-                href = a['href']
-                imdb_id_match = re.search(r'/title/(tt\d+)/', href)
-                if imdb_id_match:
-                    imdb_id = imdb_id_match.group(1)
-                    title_text = a.get_text(strip=True)
-                    if imdb_id not in imdb_ids:
-                        imdb_ids.append(imdb_id)
-                        if title_text:
-                            id_title_pairs.append((imdb_id, title_text))
-        else:
-            # Fallback generic anchor scan
-            for a_tag in soup.find_all('a', href=True):
-                href = a_tag['href']
-                imdb_id_match = re.search(r'/title/(tt\d+)/', href)
-                if imdb_id_match:
-                    imdb_id = imdb_id_match.group(1)
-                    if imdb_id not in imdb_ids:
-                        imdb_ids.append(imdb_id)
-                        title_text = a_tag.get_text(strip=True)
-                        if title_text:
-                            id_title_pairs.append((imdb_id, title_text))
+            imdb_ids = []
+            id_title_pairs = []  # (imdb_id, title, year_or_None)
+
+            # Primary structured parse: div.lister-item
+            lister_items = soup.find_all('div', class_=re.compile(r'lister-item.*'))
+            if lister_items:
+                for div in lister_items:
+                    a = div.find('a', href=True)
+                    if not a:
+                        continue
+                    href = a['href']
+                    imdb_id_match = re.search(r'/title/(tt\d+)/', href)
+                    if imdb_id_match:
+                        imdb_id = imdb_id_match.group(1)
+                        title_text = a.get_text(strip=True)
+                        if imdb_id not in imdb_ids:
+                            imdb_ids.append(imdb_id)
+                            if title_text:
+                                id_title_pairs.append((imdb_id, title_text, self._parse_lister_year(div)))
+            else:
+                # Fallback generic anchor scan
+                for a_tag in soup.find_all('a', href=True):
+                    href = a_tag['href']
+                    imdb_id_match = re.search(r'/title/(tt\d+)/', href)
+                    if imdb_id_match:
+                        imdb_id = imdb_id_match.group(1)
+                        if imdb_id not in imdb_ids:
+                            imdb_ids.append(imdb_id)
+                            title_text = a_tag.get_text(strip=True)
+                            if title_text:
+                                id_title_pairs.append((imdb_id, title_text, None))
+
+            soup.decompose()  # Release the DOM before the (possibly long) title resolve / match phase
 
         if imdb_ids:
             return imdb_ids, list_title, "Data fetched successfully.", id_title_pairs
         else:
             return [], list_title, "No IMDb IDs found in the provided URL.", []
 
-    def create_plex_playlist(self, list_url, plex_playlist_name, library_name, callback=None):
+    def create_plex_playlist(self, list_url, plex_playlist_name, library_name, callback=None, cancel=None):
         callback = callback or (lambda *a, **k: None)
+        report, callback = self._start_run_report(self.SOURCE, list_url, library_name, callback, cancel)
+        self._run_job(report, callback, plex_playlist_name,
+                      self._create_playlist, report, callback, list_url, plex_playlist_name, library_name)
+
+    def _validate_list_url(self, list_url):
         if not list_url.strip():
-            callback(False, "URL is empty. Please provide a valid URL.", [], plex_playlist_name)
-            return
+            return "URL is empty. Please provide a valid URL."
         if not re.match(r'^https?://(www\.)?imdb\.com/list/[^/]+/?$', list_url.strip()):
-            callback(False, "Invalid IMDb list URL format.", [], plex_playlist_name)
+            return "Invalid IMDb list URL format."
+        return None
+
+    def _create_playlist(self, report, callback, list_url, plex_playlist_name, library_name):
+        error = self._validate_list_url(list_url)
+        if error:
+            callback(False, error, [], plex_playlist_name, [])
             return
-        # Extended fetch returns (ids, title, message, id_title_pairs)
-        imdb_ids, derived_title, message, id_title_pairs = self.fetch_imdb_list_data(list_url)
-        if not imdb_ids:
-            callback(False, message, [], plex_playlist_name)
+        # Index the library (or libraries) in the background while the list is fetched
+        self.prefetch_library_indexes(library_name)
+        entries, info = self._open_list(report, list_url)
+        if entries is None:
+            callback(False, info['error'], [], plex_playlist_name, [])
             return
         if not plex_playlist_name.strip():
-            if derived_title:
-                plex_playlist_name = derived_title
-            else:
-                slug = list_url.rstrip('/').split('/')[-1]
-                plex_playlist_name = slug.replace('-', ' ').title() if slug else 'IMDb List'
-        # Decide whether to skip per-item fetches based on how many titles we already parsed
-        fetched_titles = []
-        if id_title_pairs and len(id_title_pairs) >= int(0.8 * len(imdb_ids)):
-            fetched_titles = [t for _, t in id_title_pairs]
-            logging.info(f"IMDb list: parsed {len(fetched_titles)} titles directly from list page (total IDs={len(imdb_ids)}). Skipping individual title fetch requests.")
-        else:
-            ia = imdb.Cinemagoer()
-            threads = []
-            queue = Queue()
-            for imdb_id in imdb_ids:
-                thread = Thread(target=self.fetch_item_details, args=(queue, ia, imdb_id))
-                threads.append(thread)
-                thread.start()
-            for thread in threads:
-                thread.join()
-            imdb_list_items = []
-            while not queue.empty():
-                imdb_list_items.append(queue.get())
-            if not imdb_list_items:
-                callback(False, "No matching items found for given IMDb IDs.")
-                return
-            fetched_titles = [title for _, title in imdb_list_items]
-            # Replace/augment id_title_pairs with fully fetched pairs to keep imdb_ids for export
-            id_title_pairs = imdb_list_items
-
-        if not fetched_titles:
+            plex_playlist_name = info['name']
+        results = self.match_entries_streaming(library_name, entries, report)
+        if not results:
             callback(False, "Failed to obtain any titles from the IMDb list.", [], plex_playlist_name, [])
             return
-        # Build ordered detailed entries including position and id
-        # We must correlate titles back to ids; prefer id_title_pairs if available; else build from imdb_ids + fetched_titles order
-        id_to_title = {}
-        if id_title_pairs:
-            for imdb_id, title in id_title_pairs:
-                id_to_title.setdefault(imdb_id, title)
-        # If we fetched via API, rebuild from imdb_list_items structure (fetched_titles preserves order but we lost ids)
-        detailed_entries = []
-        if id_to_title:
-            # Preserve original imdb_ids order when possible
-            for pos, imdb_id in enumerate(imdb_ids, start=1):
-                title = id_to_title.get(imdb_id)
-                if title and title in fetched_titles:  # ensure we actually have that title resolved
-                    detailed_entries.append({'title': title, 'imdb_id': imdb_id, 'position': pos, 'imdb_url': f'https://www.imdb.com/title/{imdb_id}/'})
-        else:
-            # Fallback: create entries using fetched_titles sequentially (ids unknown)
-            for pos, title in enumerate(fetched_titles, start=1):
-                detailed_entries.append({'title': title, 'imdb_id': None, 'position': pos, 'imdb_url': None})
-
-        # Get per-title match status
-        pairs = self.match_titles_with_status(library_name, [e['title'] for e in detailed_entries])
-        matched_items = []
-        seen_keys = set()
-        for (_title, item) in pairs:
-            if item and item.ratingKey not in seen_keys:
-                seen_keys.add(item.ratingKey)
-                matched_items.append(item)
-        unmatched_titles = [t for t, item in pairs if not item]
-        unmatched_details = [e for e in detailed_entries if e['title'] in set(unmatched_titles)]
+        # Per-ID fetches complete out of order; MatchReport restores list order
+        match = MatchReport(results)
+        matched_items = match.matched_items
+        unmatched_titles = match.unmatched_titles
+        unmatched_details = match.unmatched_details()
         matched_count = len(matched_items)
-        total_fetched = len(fetched_titles)
+        total_fetched = match.total
         unmatched_count = len(unmatched_titles)
         if matched_items:
-            self.server.createPlaylist(plex_playlist_name, items=matched_items)
+            self._write_playlist(plex_playlist_name, matched_items, report)
             logging.info(
                 f"Playlist created (IMDb): name='{plex_playlist_name}' matched={matched_count} "
                 f"unmatched={unmatched_count} total_fetched={total_fetched}"
@@ -463,16 +2303,54 @@ class PlexIMDbApp(PlexBaseApp):
         else:
             callback(False, "None of the fetched items were found in the Plex library.", unmatched_titles, plex_playlist_name, unmatched_details)
 
+    def _open_list(self, report, list_url):
+        """Fetch the IMDb list and return (entries, info) for the matcher.
+
+        ``entries`` yields ListEntry records (streamed from per-ID fetches when
+        the list page lacks titles); ``info['name']`` is the derived playlist
+        name. On failure ``entries`` is None and ``info['error']`` explains why.
+        """
+        # Extended fetch returns (ids, title, message, id_title_pairs)
+        imdb_ids, derived_title, message, id_title_pairs = self.fetch_imdb_list_data(list_url, report)
+        report.cancel.raise_if_cancelled()
+        report.count('list_ids', len(imdb_ids))
+        report.progress.update(stage='fetch', force=True, pages_fetched=1, pages_total=1, titles_total=len(imdb_ids))
+        if not imdb_ids:
+            return None, {'error': message}
+        if derived_title:
+            name = derived_title
+        else:
+            slug = list_url.rstrip('/').split('/')[-1]
+            name = slug.replace('-', ' ').title() if slug else 'IMDb List'
+        positions = {imdb_id: pos for pos, imdb_id in enumerate(imdb_ids, start=1)}
+
+        def to_entry(imdb_id, title, year=None):
+            return ListEntry(positions.get(imdb_id, 0), title, year, imdb_id=imdb_id)
+
+        # Decide whether to skip per-item fetches based on how many titles we already parsed
+        if id_title_pairs and len(id_title_pairs) >= int(0.8 * len(imdb_ids)):
+            logging.info(f"IMDb list: parsed {len(id_title_pairs)} titles directly from list page (total IDs={len(imdb_ids)}). Skipping individual title fetch requests.")
+            report.progress.update(titles_total=len(id_title_pairs), titles_resolved=len(id_title_pairs))
+            entries = (to_entry(*pair) for pair in id_title_pairs)
+        else:
+            # Titles stream into the matcher as each per-ID fetch completes
+            entries = self._stream_from_producer(
+                lambda emit: self._produce_imdb_entries(imdb_ids, lambda pair: emit(to_entry(*pair)), report),
+                report.cancel)
+        return entries, {'name': name}
+
             
 class PlexLetterboxdApp(PlexBaseApp):
-    def __init__(self, server=None):
-        super().__init__(server=server)
+    SOURCE = 'letterboxd'
+
+    def __init__(self, server=None, service=None):
+        super().__init__(server=server, service=service)
         # Configuration knobs
         self.MAX_RETRIES = 6              # Total attempts per film page
         self.BASE_DELAY = 1.0             # Base delay for exponential backoff (seconds)
         self.MIN_INTERVAL = 1.2           # Minimum spacing between successive requests (seconds)
         self.JITTER_RANGE = (0.05, 0.35)  # Added random jitter to reduce burst patterns
-        self.SESSION = requests.Session() # Reuse TCP connection & cookies
+        self.SESSION = self.service.session('letterboxd')  # Shared pooled session (TCP reuse & cookies)
         self.DEFAULT_HEADERS = {
             'User-Agent': (
                 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
@@ -493,6 +2371,54 @@ class PlexLetterboxdApp(PlexBaseApp):
         self.MISSING_RETRY = 3
         # Pagination safety cap
         self.MAX_LIST_PAGES = 30
+        # Film page lookups stream the response and stop once og:title (+ an external ID) is seen
+        self.FILM_META_MAX_BYTES = 128 * 1024
+        # Look up TMDB / IMDb IDs for titles that didn't match and retry them by Plex GUID
+        self.ID_BRIDGE_UNMATCHED = True
+        # Resumable scraping: per-list checkpoints of fetched pages / film titles (None disables)
+        self.CHECKPOINT_DIR = 'PlexPlaylistMaker_checkpoints'
+        self.CHECKPOINT_TTL = 24 * 3600  # Older checkpoints are ignored (the list may have changed)
+
+    _OG_TITLE_RE = re.compile(rb'<meta[^>]+property=["\']og:title["\'][^>]*>', re.I)
+    _CONTENT_RE = re.compile(rb'content=(?:"([^"]*)"|\'([^\']*)\')', re.I)
+    _TMDB_RE = re.compile(rb'data-tmdb-id=["\'](\d+)["\']|themoviedb\.org/(?:movie|tv)/(\d+)')
+    _IMDB_RE = re.compile(rb'imdb\.com/title/(tt\d+)')
+
+    def _read_film_meta(self, response):
+        """Read a film page incrementally and return {'title', 'year', 'tmdb_id', 'imdb_id'} or None.
+
+        Stops as soon as og:title and an external ID (TMDB or IMDb) have been
+        seen, or after FILM_META_MAX_BYTES, instead of downloading and parsing
+        the whole page. The caller closes the response, which drops the
+        unread remainder instead of draining it.
+        """
+        buf = b''
+        meta = {'title': None, 'year': None, 'tmdb_id': None, 'imdb_id': None}
+        for chunk in response.iter_content(chunk_size=8192):
+            scan_from = max(0, len(buf) - 256)  # Tags may straddle chunk boundaries
+            buf += chunk
+            window = buf[scan_from:]
+            if meta['title'] is None:
+                tag = self._OG_TITLE_RE.search(buf)
+                content = self._CONTENT_RE.search(tag.group(0)) if tag else None
+                if content:
+                    raw = content.group(1) if content.group(1) is not None else content.group(2)
+                    text = html.unescape(raw.decode(response.encoding or 'utf-8', errors='replace'))
+                    meta['title'], meta['year'] = self._split_title_year(text)
+            if meta['tmdb_id'] is None:
+                m = self._TMDB_RE.search(window)
+                if m:
+                    meta['tmdb_id'] = (m.group(1) or m.group(2)).decode()
+            if meta['imdb_id'] is None:
+                m = self._IMDB_RE.search(window)
+                if m:
+                    meta['imdb_id'] = m.group(1).decode()
+            if meta['title'] and (meta['tmdb_id'] or meta['imdb_id']):
+                break
+            if len(buf) >= self.FILM_META_MAX_BYTES:
+                break
+        logging.debug(f"Film page {response.url}: read {len(buf)} bytes.")
+        return meta if meta['title'] else None
 
     @staticmethod
     def _derive_slug_title(list_url: str) -> str:
@@ -512,99 +2438,77 @@ class PlexLetterboxdApp(PlexBaseApp):
         return titled.strip()
         
     # Maybe eventually use the offcial Letterboxd API instead of web scraping
-    def create_plex_playlist(self, list_url, plex_playlist_name, library_name, callback=None):
+    def create_plex_playlist(self, list_url, plex_playlist_name, library_name, callback=None, cancel=None):
         callback = callback or (lambda *a, **k: None)
+        report, callback = self._start_run_report(self.SOURCE, list_url, library_name, callback, cancel)
+        self._run_job(report, callback, plex_playlist_name,
+                      self._create_playlist, report, callback, list_url, plex_playlist_name, library_name)
+
+    def _validate_list_url(self, list_url):
         if not list_url.strip():
-            callback(False, "URL is empty. Please provide a valid URL.", [], plex_playlist_name)
-            return
+            return "URL is empty. Please provide a valid URL."
         if not re.match(r'^https?://(www\.)?letterboxd\.com/[^/]+/list/[^/]+/?$', list_url.strip()):
-            callback(False, "Invalid Letterboxd list URL format.", [], plex_playlist_name)
-            return
-
-        item_objects, derived_title, message = self.fetch_letterboxd_list_data(list_url)
-        if not item_objects:
-            callback(False, message, [], plex_playlist_name)
-            return
-        # Auto-name if user left playlist name blank
-        if not plex_playlist_name.strip():
-            if derived_title:
-                plex_playlist_name = derived_title
-            else:
-                slug = list_url.rstrip('/').split('/')[-1]
-                plex_playlist_name = slug.replace('-', ' ').title() if slug else 'Letterboxd List'
+            return "Invalid Letterboxd list URL format."
+        return None
 
-        # Attempt enhanced zero / low additional request extraction.
-        # 1. Collect titles we already have
-        for item in item_objects:
-            # Normalize if only title present without original_title
-            if item.get('title') and not item.get('original_title'):
-                item['original_title'] = item['title']
+    def _open_list(self, report, list_url):
+        """Return (entries, status): the streamed ListEntry records and the fetch status.
 
-        pre_parsed_titles = [item['original_title'] for item in item_objects if item.get('original_title')]
+        ``status`` ('requested', 'failures', 'error', 'name') is complete once
+        ``entries`` has been drained.
+        """
+        status = {'error': None, 'requested': 0, 'failures': [],
+                  'name': self._derive_slug_title(list_url) or 'Letterboxd List'}
+        stream = self._stream_from_producer(
+            lambda emit: self._produce_letterboxd_entries(list_url, emit, status, report), report.cancel)
+        return stream, status
 
-        # 2. Determine which still lack titles
-        missing = [item for item in item_objects if not item.get('original_title')]
+    def _after_match(self, library_name, results: list, report):
+        self._bridge_unmatched_by_id(library_name, results, report)
 
-        failures = []
-        movie_titles = pre_parsed_titles.copy()
+    def _create_playlist(self, report, callback, list_url, plex_playlist_name, library_name):
+        error = self._validate_list_url(list_url)
+        if error:
+            callback(False, error, [], plex_playlist_name, [])
+            return
 
-        if missing:
-            logging.info(f"Letterboxd: {len(pre_parsed_titles)}/{len(item_objects)} titles from list page; fetching {len(missing)} missing concurrently.")
-            fetched_missing = self._fetch_missing_titles_concurrently(missing)
-            for slug_url, title in fetched_missing['success']:
-                movie_titles.append(title)
-            failures.extend(fetched_missing['fail'])
-            if fetched_missing['fail']:
-                logging.info(f"Letterboxd: {len(fetched_missing['fail'])} film page fetches failed (will continue with available titles).")
-        else:
-            logging.info(f"Letterboxd: all {len(pre_parsed_titles)} titles parsed from list page; no per-film fetches needed.")
-
-        # Deduplicate while preserving order
-        seen_titles = set()
-        deduped = []
-        for t in movie_titles:
-            if t and t not in seen_titles:
-                seen_titles.add(t)
-                deduped.append(t)
-        movie_titles = deduped
-
-        if not movie_titles:
-            callback(False, "Failed to obtain any titles from the Letterboxd list (all fetches failed).", [], plex_playlist_name, [])
+        # Index the library (or libraries) in the background while the list is fetched
+        self.prefetch_library_indexes(library_name)
+        # Entries stream from the page fetcher (and missing-title fetches) straight
+        # into the matcher, so matching overlaps with the remaining network work.
+        stream, status = self._open_list(report, list_url)
+        results = self.match_entries_streaming(library_name, stream, report)
+        self._after_match(library_name, results, report)
+        requested_total = status['requested']
+        report.count('list_entries', requested_total)
+        if not requested_total:
+            callback(False, status['error'] or "No movies found in the provided URL.", [], plex_playlist_name, [])
             return
-        # Prepare detailed entries (position + metadata from item_objects)
-        slug_to_item = {itm['slug']: itm for itm in item_objects if 'slug' in itm}
-        detailed_entries = []
-        # Reconstruct in original order of item_objects for positions
-        for pos, itm in enumerate(item_objects, start=1):
-            title_choice = itm.get('original_title') or itm.get('title')
-            if not title_choice:
-                continue
-            detailed_entries.append({
-                'title': title_choice,
-                'original_title': itm.get('original_title') or None,
-                'film_id': itm.get('film_id'),
-                'slug': itm.get('slug'),
-                'url': itm.get('fullURL'),
-                'position': pos
-            })
-        # Per-title match outcomes
-        pairs = self.match_titles_with_status(library_name, [e['title'] for e in detailed_entries])
-        matched_items = []
-        seen_keys = set()
-        for (_title, item) in pairs:
-            if item and item.ratingKey not in seen_keys:
-                seen_keys.add(item.ratingKey)
-                matched_items.append(item)
-        unmatched_titles = [t for t, item in pairs if not item]
-        unmatched_details = [e for e in detailed_entries if e['title'] in set(unmatched_titles)]
-        requested_total = len(item_objects)
-        fetched_count = len(movie_titles)
+        # Auto-name if user left playlist name blank
+        if not plex_playlist_name.strip():
+            plex_playlist_name = status['name']
+        failures = status['failures']
+        # Pages that failed are skipped, not retried in this run; say so rather than pass a partial list off as whole
+        failed_pages = status.get('failed_pages') or []
+        pages_note = f" {self._failed_pages_note(failed_pages)}" if failed_pages else ""
+        if failed_pages:
+            report.set(failed_pages=sorted(failed_pages))
+        if not results:
+            callback(False, "Failed to obtain any titles from the Letterboxd list (all fetches failed)." + pages_note,
+                     [], plex_playlist_name, [])
+            return
+        # Missing-title fetches complete out of order; MatchReport restores list order
+        match = MatchReport(results)
+        matched_items = match.matched_items
+        unmatched_titles = match.unmatched_titles
+        unmatched_details = match.unmatched_details()
+        fetched_count = match.distinct_titles
         failures_count = len(failures)
         matched_count = len(matched_items)
         unmatched_fetched = len(unmatched_titles)
 
         if matched_items:
-            self.server.createPlaylist(plex_playlist_name, items=matched_items)
+            self._write_playlist(plex_playlist_name, matched_items, report)
             logging.info(
                 "Playlist created (Letterboxd): name='%s' requested=%d fetched=%d matched=%d "
                 "unmatched_fetched=%d fetch_failures=%d" % (
@@ -615,36 +2519,225 @@ class PlexLetterboxdApp(PlexBaseApp):
                 parts.append(f"{unmatched_fetched} fetched but not in Plex.")
             if failures_count:
                 parts.append(f"{failures_count} failed to fetch.")
-            callback(True, " ".join(parts), unmatched_titles, plex_playlist_name, unmatched_details)
+            callback(True, " ".join(parts) + pages_note, unmatched_titles, plex_playlist_name, unmatched_details)
         else:
             if fetched_count:
                 msg = (f"Fetched {fetched_count} title(s) but none matched Plex library.")
                 if failures_count:
                     msg += f" {failures_count} failed to fetch."
+                msg += pages_note
                 logging.info(
                     "Playlist creation aborted (Letterboxd): name='%s' requested=%d fetched=%d matched=0 fetch_failures=%d" % (
                         plex_playlist_name, requested_total, fetched_count, failures_count)
                 )
                 callback(False, msg, unmatched_titles, plex_playlist_name, unmatched_details)
             else:
-                callback(False, "No matching items found in Plex library.", unmatched_titles, plex_playlist_name, unmatched_details)
-        
-    def fetch_letterboxd_list_data(self, list_url):
+                callback(False, "No matching items found in Plex library." + pages_note, unmatched_titles,
+                         plex_playlist_name, unmatched_details)
+
+    def _produce_letterboxd_entries(self, list_url, emit, status, report):
+        """Fetch list pages and emit entry dicts as soon as each one has a title.
+
+        Entries titled on the list page are emitted immediately; the rest are
+        resolved from their film page on a small worker pool and emitted as each
+        completes. ``status`` receives 'requested', 'failures' (of which
+        'retryable_failures' were rate limited / network errors) and 'error'.
+        """
+        position = 0
+        from_page = 0
+        pending = []
+        checkpoint = self._open_checkpoint(list_url)
+        completed = False
+        try:
+            with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_FETCHES) as ex:
+                # Queued film fetches are dropped on cancel; running ones stop at their next wait
+                report.cancel.on_cancel(lambda: [f.cancel() for f in pending])
+                for page_items in self.iter_letterboxd_list_pages(list_url, status, report, checkpoint):
+                    report.progress.update(stage='fetch', pages_total=status.get('pages_total'), pages_fetched=1,
+                                           titles_resolved=sum(1 for entry in page_items if entry.title))
+                    for entry in page_items:
+                        position += 1
+                        entry.position = position
+                        self._apply_film_ids(entry)
+                        if entry.title:
+                            from_page += 1
+                            emit(entry)
+                        else:
+                            pending.append(ex.submit(self._resolve_missing_entry, entry, emit, status, report,
+                                                     checkpoint))
+                status['requested'] = position
+                report.progress.update(titles_total=position, force=True)
+                if pending:
+                    logging.info(f"Letterboxd: {from_page}/{position} titles from list page; fetching {len(pending)} missing concurrently.")
+                elif position:
+                    logging.info(f"Letterboxd: all {from_page} titles parsed from list page; no per-film fetches needed.")
+            # 404s and pages without a title are final; only transient failures keep the checkpoint
+            completed = not (status['error'] or status.get('retryable_failures') or status.get('failed_pages')
+                             or report.cancel.cancelled)
+        finally:
+            if checkpoint is not None:
+                checkpoint.finish(complete=completed)
+        if status.get('failed_pages'):
+            logging.info(f"Letterboxd: list page(s) {status['failed_pages']} failed; a rerun retries only those.")
+        if status['failures']:
+            logging.info(f"Letterboxd: {len(status['failures'])} film page fetches failed (will continue with available titles).")
+
+    def _resolve_missing_entry(self, entry, emit, status, report, checkpoint=None):
+        """Worker: fetch the film page title for one entry and emit it when resolved.
+
+        Titles already resolved by an interrupted earlier run come from ``checkpoint``.
+        """
+        saved = checkpoint.film(entry.slug) if checkpoint is not None else None
+        if saved:
+            title, year, tmdb_id, imdb_id = saved
+            self._remember_film_ids(entry.url, {'tmdb_id': tmdb_id, 'imdb_id': imdb_id})
+            meta = {'title': title, 'year': year} if title else {}
+            report.count('checkpoint_films_reused')
+        else:
+            start = time.perf_counter()
+            meta = self._fetch_missing_meta(entry.url, report.cancel)
+            report.add_time('film_resolve_each', time.perf_counter() - start)
+        if meta:
+            entry.title = entry.original_title = meta['title']
+            entry.year = entry.year or meta['year']
+            self._apply_film_ids(entry)
+            if checkpoint is not None and not saved:
+                checkpoint.store_film(entry.slug, entry.title, entry.year, entry.tmdb_id, entry.imdb_id)
+            report.count('films_resolved')
+            report.progress.update(stage='resolve', titles_resolved=1)
+            emit(entry)
+        else:
+            status['failures'].append(entry.url)
+            report.count('films_failed')
+            if meta is None:
+                status.setdefault('retryable_failures', []).append(entry.url)
+            elif checkpoint is not None and not saved:
+                checkpoint.store_film(entry.slug, None)  # Final (404 / no title): don't fetch it again
+
+    @staticmethod
+    def _film_slug(slug_url: str):
+        m = re.search(r'/film/([^/?#]+)', slug_url or '')
+        return m.group(1) if m else None
+
+    def _remember_film_ids(self, slug_url: str, meta: dict):
+        slug = self._film_slug(slug_url)
+        if slug and (meta.get('tmdb_id') or meta.get('imdb_id')):
+            with self.service.lock:
+                self.service.film_ids[slug] = (meta.get('tmdb_id'), meta.get('imdb_id'))
+
+    def _apply_film_ids(self, entry) -> bool:
+        """Copy cached film-page IDs onto ``entry``; True when any are known."""
+        with self.service.lock:
+            ids = self.service.film_ids.get(entry.slug)
+        if ids:
+            entry.tmdb_id, entry.imdb_id = ids
+        return bool(ids)
+
+    def _bridge_unmatched_by_id(self, library_name: str, results: list, report):
+        """Second chance for unmatched entries: read their film page IDs and look them up by Plex GUID.
+
+        Only entries whose IDs aren't cached yet cost a (head-only) film page
+        request. Matches replace the entry's result in place.
+        """
+        indexes = [(name, self._get_library_index(name)) for name in self._library_names(library_name)]
+        indexes = [(name, index) for name, index in indexes if index]
+        todo = [i for i, (entry, item) in enumerate(results) if item is None and entry.slug]
+        if not (self.ID_BRIDGE_UNMATCHED and indexes and todo):
+            return
+
+        def lookup(entry):
+            if not entry.guids and not self._apply_film_ids(entry):
+                self._fetch_missing_title(entry.url, report.cancel)  # Caches the IDs it finds
+                self._apply_film_ids(entry)
+            return entry
+
+        bridged = 0
+        with report.stage('id_bridge'), ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_FETCHES) as ex:
+            futures = {ex.submit(lookup, results[i][0]): i for i in todo}
+            report.cancel.on_cancel(lambda: [f.cancel() for f in futures])
+            for future in as_completed(futures):
+                report.cancel.raise_if_cancelled()
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    logging.debug(f"ID lookup failed: {e}")
+                    continue
+                for name, index in indexes:
+                    chosen = self._match_ids(entry, index)
+                    if chosen:
+                        results[futures[future]] = (entry, chosen)
+                        if report.match_methods is not None:
+                            report.match_methods[id(entry)] = ('guid', 1.0)
+                        self._cache_match(name, entry.title, entry.year, (chosen, 'guid', 1.0))
+                        bridged += 1
+                        break
+        if bridged:
+            report.count('matched_guid_bridge', bridged)
+            report.count('unmatched', -bridged)
+            report.progress.update(stage='match', force=True, matched=bridged, unmatched=-bridged)
+            logging.info(f"Letterboxd: matched {bridged} more title(s) by TMDB/IMDb ID.")
+
+    def fetch_letterboxd_list_data(self, list_url, report=None):
         """
         Fetch movie slugs and film IDs from a Letterboxd list.
         
         :param list_url: URL of the Letterboxd list
-        :return: (movies_data, list_title, message)
+        :param report: optional RunReport receiving list_fetch / list_parse timings
+        :return: (movies_data, list_title, message); movies_data holds dicts with
+                 'slug', 'film_id', 'fullURL' and, when known, 'title' / 'original_title' / 'year'
+
+        Read-only: unlike playlist creation it neither reads nor writes scrape checkpoints.
+        """
+        status = {'error': None}
+        movies_data = [{k: v for k, v in (('slug', e.slug), ('film_id', e.film_id), ('fullURL', e.url),
+                                          ('title', e.title), ('original_title', e.original_title),
+                                          ('year', e.year)) if v}
+                       for page_items in self.iter_letterboxd_list_pages(list_url, status, report)
+                       for e in page_items]
+        if status['error']:
+            return [], None, status['error']
+        list_title = self._derive_slug_title(list_url)
+        if movies_data:
+            return movies_data, list_title, "Data fetched successfully."
+        return [], list_title, "No movies found in the provided URL."
+
+    def _open_checkpoint(self, list_url):
+        if not self.CHECKPOINT_DIR:
+            return None
+        checkpoint = ScrapeCheckpoint(self.CHECKPOINT_DIR, list_url.strip(), self.CHECKPOINT_TTL)
+        if checkpoint.resumed:
+            logging.info(f"Letterboxd: resuming from checkpoint ({len(checkpoint.state['pages'])} page(s), "
+                         f"{len(checkpoint.state['films'])} film title(s) already fetched).")
+        return checkpoint
+
+    def iter_letterboxd_list_pages(self, list_url, status=None, report=None, checkpoint=None):
+        """Yield the film entries of a Letterboxd list one page at a time.
+
+        Each yielded list holds the page's ListEntry records (position not yet
+        assigned) not already seen on earlier pages (deduplicated by slug). Only
+        the poster divs are parsed and each page's HTML / DOM is released before
+        its entries are yielded, so memory stays flat however long the list is.
+        If the first page cannot be fetched, the error message is stored in
+        ``status['error']`` and nothing is yielded.
+
+        With a `ScrapeCheckpoint`, pages it already holds are not downloaded
+        again and each newly parsed page is recorded. A page that fails inside
+        the known page range is skipped (listed in ``status['failed_pages']``)
+        instead of ending the scrape, so a later run only refetches that page.
         """
+        from bs4 import BeautifulSoup, SoupStrainer
+        status = status if status is not None else {}
+        report = report or RunReport('adhoc')
         # Normalize base list URL (strip any /page/<n>/ suffix)
         base_url = re.sub(r'/page/\d+/?$', '/', list_url.rstrip('/'))
         if not base_url.endswith('/'):
             base_url += '/'
 
-        movies_data = []
-        list_title = self._derive_slug_title(base_url)
+        seen_slugs = set()
+        total_items = 0
         fetched_pages = 0
-        max_pages_detected = None
+        max_pages_detected = checkpoint.pages_total if checkpoint is not None else None
+        status.setdefault('failed_pages', [])
 
         def fetch_page(url):
             try:
@@ -662,56 +2755,93 @@ class PlexLetterboxdApp(PlexBaseApp):
 
         page_index = 1
         while True:
+            report.cancel.raise_if_cancelled()
             if page_index == 1:
                 page_url = base_url
             else:
                 page_url = f"{base_url}page/{page_index}/"
-            html, err = fetch_page(page_url)
+            saved = checkpoint.page(page_index) if checkpoint is not None else None
+            if saved is not None:
+                page_items = [e for e in saved if e.slug not in seen_slugs]
+                seen_slugs.update(e.slug for e in page_items)
+                fetched_pages += 1
+                report.count('checkpoint_pages_reused')
+                status['pages_total'] = max_pages_detected or page_index
+                total_items += len(page_items)
+                yield page_items
+                if (max_pages_detected and page_index >= max_pages_detected) or fetched_pages >= self.MAX_LIST_PAGES:
+                    break
+                page_index += 1
+                continue
+            with report.stage('list_fetch'):
+                html, err = fetch_page(page_url)
             if not html:
                 if page_index == 1 and err:
-                    return [], None, err
+                    status['error'] = err
+                    return
+                if err and max_pages_detected and page_index <= max_pages_detected:
+                    # A page inside the list failed (e.g. rate limited): skip it, keep the rest
+                    logging.warning(f"Letterboxd: list page {page_index} failed ({err}); continuing.")
+                    status['failed_pages'].append(page_index)
+                    if checkpoint is not None:
+                        checkpoint.page_failed(page_index)
+                    if page_index < max_pages_detected:
+                        page_index += 1
+                        continue
                 break  # stop on first missing subsequent page
-            soup = BeautifulSoup(html, 'html.parser')
+            parse_start = time.perf_counter()
+            # Pagination links are read from the raw HTML; only poster divs become a DOM
+            page_nums = [int(n) for n in re.findall(r'href="[^"]*/page/(\d+)/', html)] if max_pages_detected is None else []
+            # (strain on the slug attribute: class matching isn't reliable for multi-class tags while straining)
+            soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('div', attrs={'data-film-slug': True}))
+            html = None
             poster_divs = soup.find_all('div', class_='film-poster')
             if not poster_divs:
                 # No more items
+                soup.decompose()
+                report.add_time('list_parse', time.perf_counter() - parse_start)
                 break
+            page_items = []
             for poster_div in poster_divs:
                 movie_slug = poster_div.get('data-film-slug')
                 film_id = poster_div.get('data-film-id')
                 film_name = poster_div.get('data-film-name')
                 original_title = poster_div.get('data-original-title') or film_name
-                if (not film_name or not original_title):
+                year = poster_div.get('data-film-release-year')
+                if (not film_name or not original_title or not year):
                     img = poster_div.find('img')
                     if img and img.get('alt'):
-                        alt_title = re.sub(r'\s*\(\d{4}\)$', '', img['alt']).strip()
+                        alt_title, alt_year = self._split_title_year(img['alt'])
+                        year = year or alt_year
                         if alt_title:
                             original_title = original_title or alt_title
                             film_name = film_name or alt_title
                 if movie_slug and film_id:
-                    entry = {
-                        'slug': movie_slug.strip(),
-                        'film_id': film_id.strip(),
-                        'fullURL': f'https://letterboxd.com/film/{movie_slug.strip()}'
-                    }
-                    if film_name:
-                        entry['title'] = film_name.strip()
-                    if original_title:
-                        entry['original_title'] = original_title.strip()
-                    movies_data.append(entry)
+                    # Deduplicate by slug across pages
+                    slug = sys.intern(movie_slug.strip())
+                    if slug in seen_slugs:
+                        continue
+                    seen_slugs.add(slug)
+                    original_title = original_title.strip() if original_title else None
+                    page_items.append(ListEntry(
+                        title=original_title or (film_name.strip() if film_name else None),
+                        year=int(year) if year and str(year).isdigit() else None,
+                        original_title=original_title,
+                        film_id=film_id.strip(),
+                        slug=slug))
+            soup.decompose()
+            poster_divs = None
             fetched_pages += 1
             # Attempt to detect total pages (only once) if not already known
-            if max_pages_detected is None:
-                page_nums = []
-                for a in soup.find_all('a', href=True):
-                    m = re.search(r'/page/(\d+)/', a['href'])
-                    if m:
-                        try:
-                            page_nums.append(int(m.group(1)))
-                        except ValueError:
-                            pass
-                if page_nums:
-                    max_pages_detected = max(page_nums)
+            if max_pages_detected is None and page_nums:
+                max_pages_detected = max(page_nums)
+            report.add_time('list_parse', time.perf_counter() - parse_start)
+            report.count('list_pages')
+            status['pages_total'] = max_pages_detected or page_index
+            total_items += len(page_items)
+            if checkpoint is not None:
+                checkpoint.store_page(page_index, page_items, max_pages_detected)
+            yield page_items
             # Decide whether to continue
             if max_pages_detected and page_index >= max_pages_detected:
                 break
@@ -720,54 +2850,50 @@ class PlexLetterboxdApp(PlexBaseApp):
                 break
             page_index += 1
 
-        # Deduplicate by slug
-        unique = {}
-        ordered = []
-        for item in movies_data:
-            slug = item['slug']
-            if slug not in unique:
-                unique[slug] = True
-                ordered.append(item)
-        movies_data = ordered
-
-        if movies_data:
-            if fetched_pages > 1:
-                logging.info(f"Letterboxd: aggregated {len(movies_data)} items across {fetched_pages} page(s).")
-            return movies_data, list_title, "Data fetched successfully."
-        return [], list_title, "No movies found in the provided URL."
+        if total_items and fetched_pages > 1:
+            logging.info(f"Letterboxd: aggregated {total_items} items across {fetched_pages} page(s).")
     
-    def fetch_movie_details_from_slug_with_retry(self, slug_url):
+    def fetch_movie_details_from_slug_with_retry(self, slug_url, cancel=None):
         """Fetch movie original title from a Letterboxd film page with robust retry & backoff.
 
-        Returns dict {'original_title': title, 'url': slug_url} or None.
-        Implements:
+        Returns dict {'original_title': title, 'year': year_or_None, 'url': slug_url,
+        'tmdb_id': id_or_None, 'imdb_id': id_or_None} or None. Implements:
+          - Streaming head-only read (see `_read_film_meta`)
           - Exponential backoff with jitter
           - Honor Retry-After header on 429
           - Minimum request spacing
           - Browser-like headers & session reuse
+          - One request per film page across concurrent callers (`single_flight`)
+        Waits end early (raising PlaylistCancelled) when ``cancel`` fires.
         """
+        meta = self.service.single_flight(('letterboxd-film', slug_url),
+                                          lambda: self._fetch_film_meta_with_retry(slug_url, cancel), cancel)
+        if not meta:
+            return None
+        return {'original_title': meta['title'], 'year': meta['year'], 'url': slug_url,
+                'tmdb_id': meta['tmdb_id'], 'imdb_id': meta['imdb_id']}
+
+    def _fetch_film_meta_with_retry(self, slug_url, cancel=None):
         for attempt in range(1, self.MAX_RETRIES + 1):
             # Enforce minimum spacing between requests
             elapsed = time.time() - self._last_request_time
             if elapsed < self.MIN_INTERVAL:
                 sleep_needed = self.MIN_INTERVAL - elapsed + random.uniform(*self.JITTER_RANGE)
-                time.sleep(sleep_needed)
+                self._sleep(sleep_needed, cancel)
             try:
-                response = self.SESSION.get(slug_url, headers=self.DEFAULT_HEADERS, timeout=15)
-                self._last_request_time = time.time()
-                status = response.status_code
+                with self.SESSION.get(slug_url, headers=self.DEFAULT_HEADERS, timeout=15, stream=True) as response:
+                    self._last_request_time = time.time()
+                    status = response.status_code
+                    meta = self._read_film_meta(response) if status == 200 else None
                 if status == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    og_title_tag = soup.find('meta', property='og:title')
-                    if og_title_tag:
-                        og_title = og_title_tag['content']
-                        title_without_year = re.sub(r'\s*\(\d{4}\)$', '', og_title).strip()
-                        return {'original_title': title_without_year, 'url': slug_url}
+                    if meta:
+                        self._remember_film_ids(slug_url, meta)
+                        return meta
                     logging.warning(f"Missing og:title meta for {slug_url}")
-                    return None
+                    return {}
                 elif status == 404:
                     logging.warning(f"404 Not Found for {slug_url}; skipping.")
-                    return None
+                    return {}
                 elif status == 429:
                     # Respect Retry-After if provided, else exponential backoff
                     retry_after_header = response.headers.get('Retry-After')
@@ -776,20 +2902,22 @@ class PlexLetterboxdApp(PlexBaseApp):
                     else:
                         wait_time = (self.BASE_DELAY * (2 ** (attempt - 1))) + random.uniform(*self.JITTER_RANGE)
                     logging.debug(f"429 rate limited attempt {attempt}/{self.MAX_RETRIES} for {slug_url}; wait {wait_time:.2f}s")
-                    time.sleep(wait_time)
+                    self._sleep(wait_time, cancel)
                     continue
                 elif status in (500, 502, 503, 504):
                     wait_time = (self.BASE_DELAY * (2 ** (attempt - 1))) + random.uniform(*self.JITTER_RANGE)
                     logging.debug(f"Server error {status} attempt {attempt}/{self.MAX_RETRIES} for {slug_url}; retry in {wait_time:.2f}s")
-                    time.sleep(wait_time)
+                    self._sleep(wait_time, cancel)
                     continue
                 else:
                     logging.warning(f"Unexpected status {status} for {slug_url}; no retry.")
-                    return None
+                    return {}
             except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
                 wait_time = (self.BASE_DELAY * (2 ** (attempt - 1))) + random.uniform(*self.JITTER_RANGE)
                 logging.debug(f"Network issue '{e}' attempt {attempt}/{self.MAX_RETRIES} for {slug_url}; retry in {wait_time:.2f}s")
-                time.sleep(wait_time)
+                self._sleep(wait_time, cancel)
+            except PlaylistCancelled:
+                raise
             except Exception as e:
                 logging.error(f"Unhandled exception fetching {slug_url}: {e}")
                 return None
@@ -797,57 +2925,51 @@ class PlexLetterboxdApp(PlexBaseApp):
         return None
 
     # ---------------- Concurrency helper for missing titles -----------------
-    def _fetch_missing_titles_concurrently(self, missing_items):
-        """Fetch original titles concurrently for items lacking title info.
+    def _fetch_missing_title(self, slug_url, cancel=None):
+        """Fetch the og:title of one film page with light jitter and short retries.
 
-        Returns dict {'success': [(url,title),...], 'fail': [url,...]}.
-        Concurrency kept modest; each worker jitter-sleeps before request.
+        Returns (slug_url, title, year_or_None) or None; TMDB / IMDb IDs seen on
+        the page are cached per slug. Waits end early (raising
+        PlaylistCancelled) when ``cancel`` fires.
         """
-        results_success = []
-        results_fail = []
+        meta = self._fetch_missing_meta(slug_url, cancel)
+        return (slug_url, meta['title'], meta['year']) if meta else None
 
-        def worker(item):
-            slug_url = item['fullURL']
-            # light jitter to avoid burst
-            time.sleep(random.uniform(*self.MISSING_FETCH_JITTER))
-            headers = self.DEFAULT_HEADERS.copy()
-            for attempt in range(1, self.MISSING_RETRY + 1):
-                try:
-                    resp = requests.get(slug_url, headers=headers, timeout=10)
-                    if resp.status_code == 200:
-                        soup = BeautifulSoup(resp.text, 'html.parser')
-                        og = soup.find('meta', property='og:title')
-                        if og and og.get('content'):
-                            title = re.sub(r'\s*\(\d{4}\)$', '', og['content']).strip()
-                            if title:
-                                return (slug_url, title)
-                        return None
-                    elif resp.status_code in (429, 503):
-                        # exponential backoff with jitter
-                        time.sleep((0.6 * (2 ** (attempt - 1))) + random.uniform(0.05, 0.25))
-                        continue
-                    else:
-                        return None
-                except Exception:
-                    time.sleep(0.4 * attempt + random.uniform(0.05, 0.25))
-            return None
+    def _fetch_missing_meta(self, slug_url, cancel=None):
+        """Film page meta dict; ``{}`` when the page is gone or has no title, None after transient failures.
 
-        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_FETCHES) as ex:
-            future_map = {ex.submit(worker, item): item for item in missing_items}
-            for future in as_completed(future_map):
-                item = future_map[future]
-                slug_url = item['fullURL']
-                try:
-                    res = future.result()
-                except Exception:
-                    res = None
-                if res:
-                    results_success.append(res)
+        Concurrent requests for the same page (another job, the ID bridge)
+        share one fetch.
+        """
+        return self.service.single_flight(('letterboxd-film', slug_url),
+                                          lambda: self._fetch_film_meta_quick(slug_url, cancel), cancel)
+
+    def _fetch_film_meta_quick(self, slug_url, cancel=None):
+        # light jitter to avoid burst
+        self._sleep(random.uniform(*self.MISSING_FETCH_JITTER), cancel)
+        headers = self.DEFAULT_HEADERS.copy()
+        for attempt in range(1, self.MISSING_RETRY + 1):
+            try:
+                with self.SESSION.get(slug_url, headers=headers, timeout=10, stream=True) as resp:
+                    status = resp.status_code
+                    meta = self._read_film_meta(resp) if status == 200 else None
+                if status == 200:
+                    if meta:
+                        self._remember_film_ids(slug_url, meta)
+                    return meta or {}
+                elif status in (429, 500, 502, 503, 504):
+                    # exponential backoff with jitter
+                    self._sleep((0.6 * (2 ** (attempt - 1))) + random.uniform(0.05, 0.25), cancel)
+                    continue
                 else:
-                    results_fail.append(slug_url)
-        return {'success': results_success, 'fail': results_fail}
-    
-    
+                    return {}  # 404 etc.: final, not worth retrying
+            except PlaylistCancelled:
+                raise
+            except Exception:
+                self._sleep(0.4 * attempt + random.uniform(0.05, 0.25), cancel)
+        return None
+
+
 def check_updates(version: str):
     """Return title string with update notice using simple semantic comparison.
 
@@ -1,16 +1,31 @@
 import customtkinter as ctk
 from CTkMessagebox import CTkMessagebox
 import tkinter as tk
+from tkinter import filedialog
 import os
 import threading
 from PIL import Image
-from PlexPlaylistMakerController import PlexIMDbApp, PlexLetterboxdApp, check_updates
+from PlexPlaylistMakerController import PlexIMDbApp, PlexLetterboxdApp, LibraryIndexService, CancellationToken, SessionStore, check_updates, read_missing_csv
 from app_version import __version__
 import logging
+import multiprocessing
 import queue
 import re
+from collections import deque
 
 VERSION = __version__
+LOG_QUEUE_MAX = 5000      # Pending log lines between polls; extra lines are dropped and counted
+LOG_BUFFER_LINES = 2000   # Lines retained for the log window (ring buffer + widget trim)
+LOG_POLL_MS = 300
+PROGRESS_POLL_MS = 200  # GUI refresh cadence for progress events (latest event wins)
+PROGRESS_STAGE_LABELS = {
+    'index': "Indexing library",
+    'fetch': "Fetching list",
+    'resolve': "Resolving titles",
+    'match': "Matching",
+    'write': "Writing playlist",
+    'done': "Done",
+}
 
 class QueueHandler(logging.Handler):
     """Thread-safe logging handler that funnels LogRecords into a queue for the GUI."""
@@ -24,6 +39,7 @@ class QueueHandler(logging.Handler):
         super().__init__()
         self.log_queue = log_queue
         self.suppress_connection_errors = suppress_connection_errors
+        self.dropped = 0  # Lines discarded because the (bounded) queue was full
     def emit(self, record):
         try:
             if self.suppress_connection_errors and record.levelno >= logging.ERROR:
@@ -33,15 +49,34 @@ class QueueHandler(logging.Handler):
                     if pat.search(txt):
                         return
             msg = self.format(record)
-            self.log_queue.put(msg)
+            self.enqueue(msg)
         except Exception:
             self.handleError(record)
+    def enqueue(self, msg: str):
+        """Queue a line without ever blocking the logging thread; count it if dropped."""
+        try:
+            self.log_queue.put_nowait(msg)
+        except queue.Full:
+            self.acquire()
+            try:
+                self.dropped += 1
+            finally:
+                self.release()
+    def take_dropped(self) -> int:
+        """Return and reset the dropped-line counter."""
+        self.acquire()
+        try:
+            dropped, self.dropped = self.dropped, 0
+        finally:
+            self.release()
+        return dropped
 
 class PlexPlaylistMakerGUI(ctk.CTk):
     def __init__(self):
         super().__init__()
         # --- Logging setup ---
-        self.log_queue = queue.Queue()
+        self.log_queue = queue.Queue(maxsize=LOG_QUEUE_MAX)
+        self.log_buffer = deque(maxlen=LOG_BUFFER_LINES)  # Recent lines, kept while the window is hidden
         self.queue_handler = QueueHandler(self.log_queue, suppress_connection_errors=True)
         self.queue_handler.setFormatter(logging.Formatter('[%(asctime)s] %(levelname)s: %(message)s'))
         logging.getLogger().addHandler(self.queue_handler)
@@ -52,11 +87,17 @@ class PlexPlaylistMakerGUI(ctk.CTk):
         self.log_text_widget = None
         self.log_polling = False
         self.controller = None
+        self.controllers = {}  # Controller class -> instance, reused across tab switches
+        self.library_service = LibraryIndexService()  # Indexes / match cache / HTTP sessions shared by all controllers
+        self.session_store = SessionStore()  # Remembered sign-in / servers / libraries (delete the file to sign out)
         self.server_connection = None
+        self.plex_account = None
         self.servers = []
 
         # --- Window setup ---
-        self.title(check_updates(VERSION))
+        self.title(f"PlexPlaylistMaker - {VERSION}")
+        # The GitHub release check can take seconds offline; patch the title when it returns
+        threading.Thread(target=self._check_updates_async, name="update-check", daemon=True).start()
         self.geometry("450x350")
         self.resizable(False, False)
         self.font = ("MS Sans Serif", 12, "bold")
@@ -100,19 +141,47 @@ class PlexPlaylistMakerGUI(ctk.CTk):
         self.IMDB_playlist_name_textbox.grid(row=1, column=0, padx=10, pady=10, sticky="w")
         self.IMDB_server_menu = ctk.CTkOptionMenu(self.IMDB_frame, variable=self.server_var, values=["Loading servers..."])
         self.IMDB_server_menu.grid(row=2, column=0, padx=10, pady=10, sticky="w")
+        self.imdb_all_servers_var = tk.BooleanVar(self, value=False)
+        self.imdb_all_servers_checkbox = ctk.CTkCheckBox(self.IMDB_frame, text="All servers",
+                                                        variable=self.imdb_all_servers_var)
+        self.imdb_all_servers_checkbox.grid(row=2, column=1, padx=(0,10), pady=10, sticky="w")
+        self.IMDB_frame.all_servers_var = self.imdb_all_servers_var
         self.imdb_library_menu = ctk.CTkOptionMenu(self.IMDB_frame, variable=self.imdb_library_var, values=["Loading libraries..."])
         self.imdb_library_menu.grid(row=3, column=0, padx=10, pady=10, sticky="w")
         self.IMDB_frame.library_menu = self.imdb_library_menu
+        self.imdb_all_libraries_var = tk.BooleanVar(self, value=False)
+        self.imdb_all_libraries_checkbox = ctk.CTkCheckBox(self.IMDB_frame, text="All libraries",
+                                                          variable=self.imdb_all_libraries_var)
+        self.imdb_all_libraries_checkbox.grid(row=3, column=1, padx=(0,10), pady=10, sticky="w")
+        self.IMDB_frame.all_libraries_var = self.imdb_all_libraries_var
+        self.create_progress_widgets(self.IMDB_frame)
         self.imdb_create_playlist_button = ctk.CTkButton(self.IMDB_frame, text="Create Playlist",
                                                          command=lambda: self.start_playlist_creation(
                                                              self.IMDB_playlist_url_textbox.get(),
                                                              self.IMDB_playlist_name_textbox.get(),
                                                              self.imdb_create_playlist_button))
         self.imdb_create_playlist_button.grid(row=6, column=0, padx=10, pady=10, sticky="w")
+        self.imdb_cancel_button = ctk.CTkButton(self.IMDB_frame, text="Cancel", width=80, state=ctk.DISABLED,
+                                                command=lambda: self.cancel_playlist_creation(self.IMDB_frame))
+        self.imdb_cancel_button.grid(row=6, column=1, padx=(0,10), pady=10, sticky="w")
+        self.IMDB_frame.cancel_button = self.imdb_cancel_button
         self.imdb_export_missing_button = ctk.CTkButton(self.IMDB_frame, text="Export Missing",
                             state=ctk.DISABLED,
                             command=lambda: self.export_missing_titles(self.IMDB_frame))
         self.imdb_export_missing_button.grid(row=7, column=0, padx=10, pady=(0,10), sticky="w")
+        self.imdb_preview_button = ctk.CTkButton(self.IMDB_frame, text="Preview", width=80,
+                                                command=lambda: self.start_playlist_preview(
+                                                    self.IMDB_playlist_url_textbox.get(),
+                                                    self.IMDB_playlist_name_textbox.get(),
+                                                    self.imdb_preview_button))
+        self.imdb_preview_button.grid(row=7, column=1, padx=(0,10), pady=(0,10), sticky="w")
+        self.IMDB_frame.create_button = self.imdb_create_playlist_button
+        self.imdb_rematch_button = ctk.CTkButton(self.IMDB_frame, text="Rematch Missing",
+                                                command=lambda: self.start_rematch(
+                                                    self.IMDB_playlist_url_textbox.get(),
+                                                    self.IMDB_playlist_name_textbox.get(),
+                                                    self.imdb_rematch_button))
+        self.imdb_rematch_button.grid(row=8, column=0, padx=10, pady=(0,10), sticky="w")
 
         # --- Letterboxd frame ---
         self.Letterboxd_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
@@ -125,19 +194,47 @@ class PlexPlaylistMakerGUI(ctk.CTk):
         self.Letterboxd_playlist_name_textbox.grid(row=1, column=0, padx=10, pady=10, sticky="w")
         self.Letterboxd_server_menu = ctk.CTkOptionMenu(self.Letterboxd_frame, variable=self.server_var, values=["Loading servers..."])
         self.Letterboxd_server_menu.grid(row=2, column=0, padx=10, pady=10, sticky="w")
+        self.letterboxd_all_servers_var = tk.BooleanVar(self, value=False)
+        self.letterboxd_all_servers_checkbox = ctk.CTkCheckBox(self.Letterboxd_frame, text="All servers",
+                                                        variable=self.letterboxd_all_servers_var)
+        self.letterboxd_all_servers_checkbox.grid(row=2, column=1, padx=(0,10), pady=10, sticky="w")
+        self.Letterboxd_frame.all_servers_var = self.letterboxd_all_servers_var
         self.letterboxd_library_menu = ctk.CTkOptionMenu(self.Letterboxd_frame, variable=self.letterboxd_library_var, values=["Loading libraries..."])
         self.letterboxd_library_menu.grid(row=3, column=0, padx=10, pady=10, sticky="w")
         self.Letterboxd_frame.library_menu = self.letterboxd_library_menu
+        self.letterboxd_all_libraries_var = tk.BooleanVar(self, value=False)
+        self.letterboxd_all_libraries_checkbox = ctk.CTkCheckBox(self.Letterboxd_frame, text="All libraries",
+                                                          variable=self.letterboxd_all_libraries_var)
+        self.letterboxd_all_libraries_checkbox.grid(row=3, column=1, padx=(0,10), pady=10, sticky="w")
+        self.Letterboxd_frame.all_libraries_var = self.letterboxd_all_libraries_var
+        self.create_progress_widgets(self.Letterboxd_frame)
         self.letterboxd_create_playlist_button = ctk.CTkButton(self.Letterboxd_frame, text="Create Playlist",
                                                                command=lambda: self.start_playlist_creation(
                                                                    self.Letterboxd_playlist_url_textbox.get(),
                                                                    self.Letterboxd_playlist_name_textbox.get(),
                                                                    self.letterboxd_create_playlist_button))
         self.letterboxd_create_playlist_button.grid(row=6, column=0, padx=10, pady=10, sticky="w")
+        self.letterboxd_cancel_button = ctk.CTkButton(self.Letterboxd_frame, text="Cancel", width=80, state=ctk.DISABLED,
+                                                      command=lambda: self.cancel_playlist_creation(self.Letterboxd_frame))
+        self.letterboxd_cancel_button.grid(row=6, column=1, padx=(0,10), pady=10, sticky="w")
+        self.Letterboxd_frame.cancel_button = self.letterboxd_cancel_button
         self.letterboxd_export_missing_button = ctk.CTkButton(self.Letterboxd_frame, text="Export Missing",
                                   state=ctk.DISABLED,
                                   command=lambda: self.export_missing_titles(self.Letterboxd_frame))
         self.letterboxd_export_missing_button.grid(row=7, column=0, padx=10, pady=(0,10), sticky="w")
+        self.letterboxd_preview_button = ctk.CTkButton(self.Letterboxd_frame, text="Preview", width=80,
+                                                command=lambda: self.start_playlist_preview(
+                                                    self.Letterboxd_playlist_url_textbox.get(),
+                                                    self.Letterboxd_playlist_name_textbox.get(),
+                                                    self.letterboxd_preview_button))
+        self.letterboxd_preview_button.grid(row=7, column=1, padx=(0,10), pady=(0,10), sticky="w")
+        self.Letterboxd_frame.create_button = self.letterboxd_create_playlist_button
+        self.letterboxd_rematch_button = ctk.CTkButton(self.Letterboxd_frame, text="Rematch Missing",
+                                                command=lambda: self.start_rematch(
+                                                    self.Letterboxd_playlist_url_textbox.get(),
+                                                    self.Letterboxd_playlist_name_textbox.get(),
+                                                    self.letterboxd_rematch_button))
+        self.letterboxd_rematch_button.grid(row=8, column=0, padx=10, pady=(0,10), sticky="w")
 
         self.current_frame = "imdb_frame"
 
@@ -154,6 +251,8 @@ class PlexPlaylistMakerGUI(ctk.CTk):
         self.create_logging_toggle_button()
         self.bind('<Control-L>', self.toggle_connection_error_logging)
         self.update_create_buttons_state()
+        # Always drain the bounded log queue into the ring buffer, window open or not
+        self.start_log_polling()
 
     def create_logging_toggle_button(self):
         """Add a button in the navigation frame to open/close the log window."""
@@ -166,6 +265,74 @@ class PlexPlaylistMakerGUI(ctk.CTk):
         )
         self.log_toggle_button.grid(row=3, column=0, padx=5, pady=5, sticky="ew")
 
+    def create_progress_widgets(self, frame):
+        """Add a progress bar and a status line (rows 4-5) to a source frame.
+
+        Each frame gets its own progress queue (fed by its tab's controller)
+        and polling flag, so jobs on both tabs can run side by side.
+        """
+        frame.progress_queue = queue.Queue()
+        frame.progress_polling = False
+        frame.progress_bar = ctk.CTkProgressBar(frame, width=200)
+        frame.progress_bar.grid(row=4, column=0, padx=10, pady=(4, 0), sticky="w")
+        frame.progress_bar.set(0)
+        frame.progress_label = ctk.CTkLabel(frame, text="", font=("MS Sans Serif", 11))
+        frame.progress_label.grid(row=5, column=0, padx=10, pady=(0, 4), sticky="w")
+
+    def start_progress_polling(self, frame):
+        frame.progress_bar.set(0)
+        frame.progress_label.configure(text="")
+        # Drop stale events from a previous job
+        try:
+            while True:
+                frame.progress_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if not frame.progress_polling:
+            frame.progress_polling = True
+            self.after(PROGRESS_POLL_MS, self.poll_progress_queue, frame)
+
+    def stop_progress_polling(self, frame):
+        self.poll_progress_queue(frame, reschedule=False)
+        frame.progress_polling = False
+
+    def poll_progress_queue(self, frame, reschedule=True):
+        """Render only the newest ProgressEvent queued for ``frame``; older ones are coalesced away."""
+        if not frame.progress_polling:
+            return
+        latest = None
+        try:
+            while True:
+                latest = frame.progress_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if latest is not None:
+            self.render_progress(frame, latest)
+        if reschedule:
+            self.after(PROGRESS_POLL_MS, self.poll_progress_queue, frame)
+
+    def render_progress(self, frame, event):
+        if event.stage == 'index' and event.titles_total:
+            fraction = event.titles_resolved / event.titles_total  # Items scanned; nothing is matched yet
+        elif event.titles_total:
+            fraction = event.processed / event.titles_total
+        elif event.pages_total:
+            fraction = event.pages_fetched / event.pages_total
+        else:
+            fraction = 0.0
+        frame.progress_bar.set(1.0 if event.stage == 'done' else min(fraction, 1.0))
+        parts = [PROGRESS_STAGE_LABELS.get(event.stage, event.stage)]
+        if event.pages_total and event.pages_total > 1:
+            parts.append(f"page {event.pages_fetched}/{event.pages_total}")
+        if event.processed:
+            parts.append(f"{event.matched} matched / {event.unmatched} missing")
+            parts.append(f"{event.throughput:.0f}/s")
+        if event.stage == 'index' and event.titles_total:
+            parts.append(f"{event.titles_resolved}/{event.titles_total} items")
+        if event.eta is not None and event.stage in ('fetch', 'resolve', 'match'):
+            parts.append(f"ETA {event.eta:.0f}s")
+        frame.progress_label.configure(text=" · ".join(parts))
+
     def toggle_log_window(self):
         if self.log_window and tk.Toplevel.winfo_exists(self.log_window):
             self.hide_log_window()
@@ -188,6 +355,8 @@ class PlexPlaylistMakerGUI(ctk.CTk):
         self.log_text_widget.pack(fill=tk.BOTH, expand=True)
         self.log_text_widget.configure(yscrollcommand=scrollbar.set)
         scrollbar.configure(command=self.log_text_widget.yview)
+        # Show what was logged while the window was hidden
+        self.append_log_lines(list(self.log_buffer))
         # Control buttons
         btn_frame = tk.Frame(self.log_window)
         btn_frame.pack(fill=tk.X)
@@ -196,17 +365,16 @@ class PlexPlaylistMakerGUI(ctk.CTk):
         close_btn = tk.Button(btn_frame, text="Hide", command=self.hide_log_window)
         close_btn.pack(side=tk.LEFT, padx=4, pady=4)
         self.log_toggle_button.configure(text="Hide Logs")
-        self.start_log_polling()
 
     def hide_log_window(self):
         if self.log_window and tk.Toplevel.winfo_exists(self.log_window):
-            self.stop_log_polling()
             self.log_window.destroy()
         self.log_window = None
         self.log_text_widget = None
         self.log_toggle_button.configure(text="Show Logs")
 
     def clear_logs(self):
+        self.log_buffer.clear()
         if self.log_text_widget:
             self.log_text_widget.configure(state='normal')
             self.log_text_widget.delete('1.0', tk.END)
@@ -215,29 +383,47 @@ class PlexPlaylistMakerGUI(ctk.CTk):
     def start_log_polling(self):
         if not self.log_polling:
             self.log_polling = True
-            self.after(200, self.poll_log_queue)
+            self.after(LOG_POLL_MS, self.poll_log_queue)
 
     def stop_log_polling(self):
         self.log_polling = False
 
     def poll_log_queue(self):
+        """Drain pending lines into the ring buffer and flush them to the widget in one insert."""
         if not self.log_polling:
             return
+        batch = []
         try:
-            while True:
-                msg = self.log_queue.get_nowait()
-                self.append_log_message(msg)
+            # Bounded drain: at most one full queue per poll
+            while len(batch) < LOG_QUEUE_MAX:
+                batch.append(self.log_queue.get_nowait())
         except queue.Empty:
             pass
-        self.after(500, self.poll_log_queue)
+        dropped = self.queue_handler.take_dropped()
+        if dropped:
+            batch.append(f"[LOG] {dropped} message(s) dropped (log queue full).")
+        if batch:
+            self.log_buffer.extend(batch)
+            self.append_log_lines(batch[-LOG_BUFFER_LINES:])
+        self.after(LOG_POLL_MS, self.poll_log_queue)
 
-    def append_log_message(self, msg: str):
-        if not self.log_text_widget:
+    def append_log_lines(self, lines):
+        """Insert many lines with a single widget update, trimming to LOG_BUFFER_LINES."""
+        if not self.log_text_widget or not lines:
             return
-        self.log_text_widget.configure(state='normal')
-        self.log_text_widget.insert(tk.END, msg + "\n")
-        self.log_text_widget.configure(state='disabled')
-        self.log_text_widget.see(tk.END)
+        widget = self.log_text_widget
+        widget.configure(state='normal')
+        widget.insert(tk.END, "\n".join(lines) + "\n")
+        # 'end-1c' is the line after the trailing newline, so line count = that index - 1
+        excess = int(widget.index('end-1c').split('.')[0]) - 1 - LOG_BUFFER_LINES
+        if excess > 0:
+            widget.delete('1.0', f'{excess + 1}.0')
+        widget.configure(state='disabled')
+        widget.see(tk.END)
+
+    def append_log_message(self, msg: str):
+        self.log_buffer.append(msg)
+        self.append_log_lines([msg])
 
     def select_frame_by_name(self, frame_name):
         """Selects and displays the specified frame, and performs common post-selection actions."""
@@ -264,19 +450,39 @@ class PlexPlaylistMakerGUI(ctk.CTk):
         if not self.server_connection:
             threading.Thread(target=self.async_login_and_fetch_servers).start()
             
+    def _check_updates_async(self):
+        title = check_updates(VERSION)
+        try:
+            self.after(0, self.title, title)
+        except (RuntimeError, tk.TclError):  # Window already closed
+            pass
+
     def switch_to_imdb_controller(self):
         """Switches the current controller to the IMDb controller."""
-        if not isinstance(self.controller, PlexIMDbApp):
-            self.controller = PlexIMDbApp(server=self.server_connection)
-        # Ensure the server connection is set in the controller
-        self.controller.server = self.server_connection
+        self._activate_controller(PlexIMDbApp)
 
     def switch_to_letterboxd_controller(self):
         """Switches the current controller to the Letterboxd controller."""
-        if not isinstance(self.controller, PlexLetterboxdApp):
-            self.controller = PlexLetterboxdApp(server=self.server_connection)
-        # Ensure the server connection is set in the controller
-        self.controller.server = self.server_connection
+        self._activate_controller(PlexLetterboxdApp)
+
+    def _activate_controller(self, controller_cls):
+        """Reuse (or create once) the controller for a source; all share the library service.
+
+        Each controller reports progress to its own tab's queue.
+        """
+        if self.controller is not None and self.controller.plex_account:
+            self.plex_account = self.controller.plex_account
+        controller = self.controllers.get(controller_cls)
+        if controller is None:
+            controller = controller_cls(server=self.server_connection, service=self.library_service)
+            frame = self.IMDB_frame if controller_cls is PlexIMDbApp else self.Letterboxd_frame
+            controller.progress_channel = frame.progress_queue
+            controller.session_store = self.session_store
+            self.controllers[controller_cls] = controller
+        # Ensure the shared server connection / account are set in the controller
+        controller.server = self.server_connection
+        controller.plex_account = self.plex_account or controller.plex_account
+        self.controller = controller
 
 
     def imdb_button_event(self):
@@ -304,25 +510,37 @@ class PlexPlaylistMakerGUI(ctk.CTk):
         def fetch_servers():
             # Show the loading overlay
             self.show_overlay()
-            # Perform the login and fetch operation. This method will run on a separate thread
-            self.controller.login_and_fetch_servers(self.server_login_callback)
+            # Reuse the stored sign-in if there is one (revalidated in the background),
+            # otherwise perform the OAuth login. This method will run on a separate thread
+            if not self.controller.resume_session(self.server_login_callback):
+                self.controller.login_and_fetch_servers(self.server_login_callback)
             self.server_connection = self.controller.server  # Update the shared server connection
+            self.plex_account = self.controller.plex_account
         
         # Start the server fetching process
         threading.Thread(target=fetch_servers).start()
     
-    def server_login_callback(self, servers, success):
+    def server_login_callback(self, servers, success, revalidated=False, expired=False, server=None):
         # Ensure UI updates run on main thread (controller invokes callback from worker thread)
         if threading.current_thread() is not threading.main_thread():
-            self.after(0, lambda: self.server_login_callback(servers, success))
+            self.after(0, lambda: self.server_login_callback(servers, success, revalidated, expired, server))
+            return
+        # Pick up the connection / account the controller just established (or revalidated)
+        self.server_connection = self.controller.server
+        self.plex_account = self.controller.plex_account or self.plex_account
+        if expired:
+            # The stored sign-in was revoked: fall back to the normal browser login
+            self.server_connection = None
+            self.hide_overlay()
+            self.async_login_and_fetch_servers()
             return
         # Re-enable the IMDb and Letterboxd buttons after server fetch completes.
         self.IMDB.configure(state=ctk.NORMAL)
         self.Letterboxd.configure(state=ctk.NORMAL)
         
         if success:
-            # Update the UI with the server list if login was successful.
-            self.update_server_menus(servers)
+            # Update the UI with the server list if login was successful (showing the resumed server, if any).
+            self.update_server_menus(servers, selected=server)
             if self.controller.server:  # Auto-connected (only one server)
                 filtered_libraries = [lib['name'] for lib in self.controller.libraries if lib['type'] in ('movie', 'show')]
                 self.update_library_dropdown(filtered_libraries, self.IMDB_frame)
@@ -408,7 +626,7 @@ class PlexPlaylistMakerGUI(ctk.CTk):
         menu = ctk.CTkOptionMenu(target_frame,
                                  variable=lib_var,
                                  values=libraries,
-                                 command=lambda _sel: self.library_selection_changed())
+                                 command=self.library_selection_changed)
         menu.grid(row=3, column=0, padx=10, pady=10, sticky="w")
         if libraries:
             lib_var.set(libraries[0])
@@ -421,8 +639,11 @@ class PlexPlaylistMakerGUI(ctk.CTk):
         elif target_frame is self.Letterboxd_frame:
             self.letterboxd_library_var = lib_var
             self.letterboxd_library_menu = menu
+        if libraries:
+            # Start indexing the default selection right away
+            self.library_selection_changed(libraries[0])
         
-    def recreate_server_dropdown(self, frame, variable, servers, row, column, padx, pady, sticky):
+    def recreate_server_dropdown(self, frame, variable, servers, row, column, padx, pady, sticky, selected=None):
         """
         Recreate a server dropdown menu with updated servers.
 
@@ -435,6 +656,7 @@ class PlexPlaylistMakerGUI(ctk.CTk):
             padx: The padding along the x axis.
             pady: The padding along the y axis.
             sticky: The sticky option to define how the widget expands.
+            selected: The server to show as selected (defaults to the first one).
         """
         # Create a new CTkOptionMenu with the updated server names
         server_menu = ctk.CTkOptionMenu(
@@ -447,13 +669,16 @@ class PlexPlaylistMakerGUI(ctk.CTk):
 
         # Set the default/selected server if the list is not empty
         if servers:
-            variable.set(servers[0])
+            variable.set(selected if selected in servers else servers[0])
 
         # Return the newly created dropdown menu
         return server_menu
         
-    def update_server_menus(self, servers, server_var=None):
-        """Recreate IMDb and Letterboxd server dropdown menus with updated servers."""
+    def update_server_menus(self, servers, server_var=None, selected=None):
+        """Recreate IMDb and Letterboxd server dropdown menus with updated servers.
+
+        ``selected`` is the server the controller is connected to, if known.
+        """
         self.servers = servers  # Store the updated list of servers
 
         # Recreate the IMDb server dropdown menu with updated servers
@@ -465,7 +690,8 @@ class PlexPlaylistMakerGUI(ctk.CTk):
             column=0,
             padx=10,
             pady=10,
-            sticky="w"
+            sticky="w",
+            selected=selected
         )
 
         # Recreate the Letterboxd server dropdown menu with updated servers
@@ -477,7 +703,8 @@ class PlexPlaylistMakerGUI(ctk.CTk):
             column=0,
             padx=10,
             pady=10,
-            sticky="w"
+            sticky="w",
+            selected=selected
         )
 
     def on_server_selected(self, selected_server: str):
@@ -501,49 +728,217 @@ class PlexPlaylistMakerGUI(ctk.CTk):
             self.after(0, lambda: CTkMessagebox(title="Error", message=f"Failed to connect to server '{server_name}'.", icon="cancel", option_1="OK"))
         self.after(0, self.hide_overlay)
 
-    def library_selection_changed(self):
-        """Library dropdown changed; reevaluate button states."""
+    def library_selection_changed(self, library_name=None):
+        """Library dropdown changed; reevaluate button states and start indexing the library.
+
+        The index is built in the background so it is usually ready (or close to
+        it) by the time a list has been fetched.
+        """
         self.update_create_buttons_state()
+        if library_name and library_name not in ("Select a server", "Loading libraries...") \
+                and self.controller and self.controller.server:
+            self.controller.prefetch_library_index(library_name)
 
     def update_create_buttons_state(self):
-        """Enable or disable Create Playlist buttons based on server connection & library selection."""
+        """Enable or disable the job buttons based on server connection, library selection and running jobs.
+
+        Create, Preview and Rematch stay disabled on a tab while one of its jobs
+        runs (they share the tab's cancel token and progress display).
+        """
         server_ready = bool(self.controller and self.controller.server)
         def lib_ok(frame):
             return hasattr(frame, 'library_var') and frame.library_var.get() \
-                and frame.library_var.get() not in ("Select a server", "Loading libraries...")
+                and frame.library_var.get() not in ("Select a server", "Loading libraries...") \
+                and not getattr(frame, 'job_running', False)
         imdb_ready = server_ready and lib_ok(self.IMDB_frame)
         letter_ready = server_ready and lib_ok(self.Letterboxd_frame)
         if hasattr(self, 'imdb_create_playlist_button'):
             self.imdb_create_playlist_button.configure(state=ctk.NORMAL if imdb_ready else ctk.DISABLED)
         if hasattr(self, 'letterboxd_create_playlist_button'):
             self.letterboxd_create_playlist_button.configure(state=ctk.NORMAL if letter_ready else ctk.DISABLED)
+        if hasattr(self, 'imdb_preview_button'):
+            self.imdb_preview_button.configure(state=ctk.NORMAL if imdb_ready else ctk.DISABLED)
+        if hasattr(self, 'letterboxd_preview_button'):
+            self.letterboxd_preview_button.configure(state=ctk.NORMAL if letter_ready else ctk.DISABLED)
+        if hasattr(self, 'imdb_rematch_button'):
+            self.imdb_rematch_button.configure(state=ctk.NORMAL if imdb_ready else ctk.DISABLED)
+        if hasattr(self, 'letterboxd_rematch_button'):
+            self.letterboxd_rematch_button.configure(state=ctk.NORMAL if letter_ready else ctk.DISABLED)
 
-    def start_playlist_creation(self, url, name, button):
-        # Determine which frame is currently active and get the selected library from the correct dropdown
+    def _active_creation_frame(self):
+        """The frame of the current tab, or None (after reporting the error)."""
         if self.current_frame == "imdb_frame":
-            selected_library = self.IMDB_frame.library_var.get()
-            creation_frame = self.IMDB_frame
-        elif self.current_frame == "letterboxd_frame":
-            selected_library = self.Letterboxd_frame.library_var.get()
-            creation_frame = self.Letterboxd_frame
-        else:
-            CTkMessagebox(title="Error", message="Error: No active frame identified.", icon="cancel", option_1="OK")
-            return
+            return self.IMDB_frame
+        if self.current_frame == "letterboxd_frame":
+            return self.Letterboxd_frame
+        CTkMessagebox(title="Error", message="Error: No active frame identified.", icon="cancel", option_1="OK")
+        return None
+
+    def _begin_job(self, creation_frame):
+        """Reset the frame's export state, start progress polling and hand out a fresh cancel token."""
         # Clear previous unmatched titles for that frame and disable export until finished
         creation_frame.unmatched_titles = []
         if creation_frame is self.IMDB_frame and hasattr(self, 'imdb_export_missing_button'):
             self.imdb_export_missing_button.configure(state=ctk.DISABLED)
         if creation_frame is self.Letterboxd_frame and hasattr(self, 'letterboxd_export_missing_button'):
             self.letterboxd_export_missing_button.configure(state=ctk.DISABLED)
+        self.start_progress_polling(creation_frame)
+        # One token per job; the Cancel button fires it and the controller winds down cooperatively
+        creation_frame.cancel_token = cancel_token = CancellationToken()
+        creation_frame.cancel_button.configure(text="Cancel", state=ctk.NORMAL)
+        creation_frame.job_running = True
+        self.update_create_buttons_state()
+        return cancel_token
+
+    def _end_job(self, creation_frame):
+        """Counterpart of `_begin_job`, run from the job's callback: unlock the frame's job buttons."""
+        creation_frame.cancel_button.configure(text="Cancel", state=ctk.DISABLED)
+        creation_frame.cancel_token = None
+        creation_frame.job_running = False
+        self.update_create_buttons_state()
+
+    def start_playlist_creation(self, url, name, button):
+        # Determine which frame is currently active and get the selected library from the correct dropdown
+        creation_frame = self._active_creation_frame()
+        if creation_frame is None:
+            return
+        selected_library = self._selected_libraries(creation_frame)
+        cancel_token = self._begin_job(creation_frame)
+        controller = self.controller
+        mirror_servers = list(self.servers) if creation_frame.all_servers_var.get() and len(self.servers) > 1 else None
         
         def run():
             # Update button text to indicate process start and disable it
             self.after(0, lambda: self.update_button_text_dynamically("Creating Playlist", button, disable=True))
             
-            # Call the create playlist method with the selected library
-            self.controller.create_plex_playlist(url, name, selected_library, lambda success, message, unmatched, playlist_name, unmatched_details: self.after(0, self.playlist_creation_callback, success, message, unmatched, playlist_name, unmatched_details, button, creation_frame))
+            callback = lambda success, message, unmatched, playlist_name, unmatched_details: self.after(0, self.playlist_creation_callback, success, message, unmatched, playlist_name, unmatched_details, button, creation_frame)
+            if mirror_servers:
+                # Fetch once, then match & write on every server (libraries are matched by name)
+                controller.mirror_playlist(url, name, {server: selected_library for server in mirror_servers},
+                                           callback, cancel=cancel_token)
+            else:
+                # Call the create playlist method with the selected library
+                controller.create_plex_playlist(url, name, selected_library, callback, cancel=cancel_token)
         
-        threading.Thread(target=run).start()
+        threading.Thread(target=run, daemon=True).start()
+
+    def start_playlist_preview(self, url, name, button):
+        """Dry run on the current server: fetch and match, show the plan, then optionally create it.
+
+        "All servers" is not previewed; the dialog says so when it is ticked.
+        """
+        creation_frame = self._active_creation_frame()
+        if creation_frame is None:
+            return
+        selected_library = self._selected_libraries(creation_frame)
+        cancel_token = self._begin_job(creation_frame)
+        controller = self.controller
+        server_note = ""
+        if creation_frame.all_servers_var.get() and len(self.servers) > 1:
+            server_note = (f"\n\nThis plan covers only the current server ({self.server_var.get()}); "
+                           "the other servers are not previewed or written.")
+
+        def run():
+            self.after(0, lambda: self.update_button_text_dynamically("Previewing", button, disable=True))
+            outcome = []
+            plan = controller.preview_playlist(url, name, selected_library, lambda *args: outcome.append(args),
+                                               cancel=cancel_token)
+            args = outcome[0] if outcome else (False, "Preview failed; see the log for details.", [], name, [])
+            if plan is not None and args[0]:
+                args = (args[0], args[1] + server_note) + tuple(args[2:])
+            self.after(0, self.playlist_preview_callback, controller, plan, *args, button, creation_frame)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def playlist_preview_callback(self, controller, plan, success, message, unmatched_titles, playlist_name,
+                                  unmatched_details, button, creation_frame):
+        self.update_button_text_dynamically("Preview", button, disable=False)
+        self.stop_progress_polling(creation_frame)
+        cancelled = not success and creation_frame.cancel_token is not None and creation_frame.cancel_token.cancelled
+        self._end_job(creation_frame)
+        self._store_unmatched(creation_frame, unmatched_titles, unmatched_details, playlist_name)
+        if plan is not None and success:
+            answer = CTkMessagebox(title="Preview", message=f"{message}\n\nCreate this playlist now?", icon="question",
+                                   option_1="Not now", option_2="Create").get()
+            if answer == "Create":
+                self.commit_preview(controller, plan, creation_frame)
+        elif cancelled:
+            CTkMessagebox(title="Cancelled", message=message, icon="info", option_1="OK")
+        else:
+            CTkMessagebox(title="Preview", message=message, icon="cancel" if plan is None else "info", option_1="OK")
+
+    def commit_preview(self, controller, plan, creation_frame):
+        """Write a previewed plan as-is (no second fetch or match)."""
+        button = creation_frame.create_button
+        cancel_token = self._begin_job(creation_frame)
+
+        def run():
+            self.after(0, lambda: self.update_button_text_dynamically("Creating Playlist", button, disable=True))
+            controller.commit_plan(plan, None, lambda success, message, unmatched, playlist_name, unmatched_details: self.after(0, self.playlist_creation_callback, success, message, unmatched, playlist_name, unmatched_details, button, creation_frame), cancel=cancel_token)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def start_rematch(self, url, name, button):
+        """Re-match only the titles a previous run missed and append new hits to its playlist.
+
+        The unmatched set comes from this session's last run on the tab, else
+        from the run report, else from an exported Missing CSV the user picks.
+        """
+        creation_frame = self._active_creation_frame()
+        if creation_frame is None:
+            return
+        controller = self.controller
+        name = name.strip()
+        entries = getattr(creation_frame, 'unmatched_details', None)
+        if entries and name in ('', getattr(creation_frame, 'last_playlist_name', None)):
+            name = creation_frame.last_playlist_name
+        else:
+            record = controller.last_unmatched_run(name or None, url.strip() or None)
+            if record is not None:
+                entries, name = record['unmatched'], record['playlist_name']
+            else:
+                if not name:
+                    CTkMessagebox(title="Rematch", message="No earlier run with missing titles was found. Enter the "
+                                  "playlist name to add to, then pick an exported Missing CSV.", icon="info",
+                                  option_1="OK")
+                    return
+                path = filedialog.askopenfilename(title="Exported Missing CSV", filetypes=[("CSV files", "*.csv")])
+                if not path:
+                    return
+                try:
+                    entries = read_missing_csv(path)
+                except (OSError, ValueError) as e:
+                    CTkMessagebox(title="Error", message=f"Failed to read {path}: {e}", icon="cancel", option_1="OK")
+                    return
+        selected_library = self._selected_libraries(creation_frame)
+        cancel_token = self._begin_job(creation_frame)
+
+        def run():
+            self.after(0, lambda: self.update_button_text_dynamically("Rematching", button, disable=True))
+            controller.rematch_playlist(entries, name, selected_library, lambda success, message, unmatched, playlist_name, unmatched_details: self.after(0, self.playlist_creation_callback, success, message, unmatched, playlist_name, unmatched_details, button, creation_frame, "Rematch Missing"), cancel=cancel_token, list_url=url.strip() or None)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _selected_libraries(self, frame):
+        """The chosen library name, or with "All libraries" ticked every listed library of the same
+        type (movie / show) as the chosen one, chosen one first."""
+        selected = frame.library_var.get()
+        if not frame.all_libraries_var.get():
+            return selected
+        # A movie list must not be matched against TV libraries (an exact show hit would beat a fuzzy film hit)
+        types = {lib['name']: lib['type'] for lib in self.controller.libraries}
+        others = [name for name in frame.library_menu.cget('values')
+                  if name != selected and types.get(name) == types.get(selected)]
+        return [selected] + others
+
+    def cancel_playlist_creation(self, frame):
+        """Ask the running job on ``frame`` to stop; its callback fires once it has wound down."""
+        token = getattr(frame, 'cancel_token', None)
+        if token is None or token.cancelled:
+            return
+        logging.info("Cancelling playlist creation...")
+        frame.cancel_button.configure(text="Cancelling...", state=ctk.DISABLED)
+        token.cancel()
 
     # Method to dynamically update button text with loading dots
     def update_button_text_dynamically(self, base_text, button, disable=False):
@@ -573,15 +968,25 @@ class PlexPlaylistMakerGUI(ctk.CTk):
             button.configure(text=base_text, state=ctk.NORMAL)  # Re-enable the button
 
     # Callback method to be called once playlist creation is done
-    def playlist_creation_callback(self, success, message, unmatched_titles, playlist_name, unmatched_details, button, creation_frame):
+    def playlist_creation_callback(self, success, message, unmatched_titles, playlist_name, unmatched_details, button, creation_frame,
+                                   button_text="Create Playlist"):
         # Stop any ongoing text animation and reset the button text and state
-        self.update_button_text_dynamically("Create Playlist", button, disable=False)
+        self.update_button_text_dynamically(button_text, button, disable=False)
+        self.stop_progress_polling(creation_frame)
+        cancelled = not success and getattr(creation_frame, 'cancel_token', None) is not None \
+            and creation_frame.cancel_token.cancelled
+        self._end_job(creation_frame)
         
         # Display the message using CTkMessagebox based on success status
-        if success:
+        if cancelled:
+            CTkMessagebox(title="Cancelled", message=message, icon="info", option_1="OK")
+        elif success:
             CTkMessagebox(title="Success", message=message, icon="check", option_1="OK")
         else:
             CTkMessagebox(title="Error", message=message, icon="cancel", option_1="OK")
+        self._store_unmatched(creation_frame, unmatched_titles, unmatched_details, playlist_name)
+
+    def _store_unmatched(self, creation_frame, unmatched_titles, unmatched_details, playlist_name):
         # Store unmatched titles on the creation frame (not necessarily current frame if user switched)
         creation_frame.unmatched_titles = unmatched_titles or []
         creation_frame.unmatched_details = unmatched_details or []
@@ -608,33 +1013,31 @@ class PlexPlaylistMakerGUI(ctk.CTk):
             filename = f"Missing_{safe_base}_{timestamp}.csv"
             with open(filename, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
-                # Determine columns dynamically based on first detail record
+                # Columns are chosen over all records (rows differ, e.g. Letterboxd films with a known IMDb ID);
+                # every row fills every column so values stay under their header
+                has = {key for d in details for key in d}.__contains__
                 base_headers = ['Position', 'Title']
                 extra_headers = []
-                if details:
-                    sample = details[0]
-                    if 'imdb_id' in sample:
-                        extra_headers.extend(['IMDb ID', 'IMDb URL'])
-                    if 'original_title' in sample:
-                        extra_headers.append('Original Title')
-                    if 'film_id' in sample:
-                        extra_headers.extend(['Film ID', 'Letterboxd URL', 'Slug'])
+                if has('year'):
+                    base_headers.append('Year')
+                if has('imdb_id'):
+                    extra_headers.extend(['IMDb ID', 'IMDb URL'])
+                if has('original_title'):
+                    extra_headers.append('Original Title')
+                if has('film_id'):
+                    extra_headers.extend(['Film ID', 'Letterboxd URL', 'Slug'])
                 writer.writerow(base_headers + extra_headers)
-                # Build a lookup by title to its detail entry (choose first occurrence)
-                detail_map = {}
-                # Also build map by imdb_id if available to ensure uniqueness
-                for d in details:
-                    title_key = d.get('title')
-                    if title_key and title_key not in detail_map:
-                        detail_map[title_key] = d
-                for t in titles:
-                    d = detail_map.get(t, {})
-                    row = [d.get('position') or '', t]
-                    if 'imdb_id' in d:
-                        row.extend([d.get('imdb_id') or '', d.get('imdb_url') or '' ])
-                    if 'original_title' in d:
+                # One row per unmatched entry, in list order (duplicate titles stay separate rows)
+                rows = details or [{'title': t} for t in titles]
+                for d in rows:
+                    row = [d.get('position') or '', d.get('title') or '']
+                    if has('year'):
+                        row.append(d.get('year') or '')
+                    if has('imdb_id'):
+                        row.extend([d.get('imdb_id') or '', d.get('imdb_url') or ''])
+                    if has('original_title'):
                         row.append(d.get('original_title') or '')
-                    if 'film_id' in d:
+                    if has('film_id'):
                         row.extend([d.get('film_id') or '', d.get('url') or '', d.get('slug') or ''])
                     writer.writerow(row)
             CTkMessagebox(title="Exported", message=f"Missing titles exported to {filename}", icon="check", option_1="OK")
@@ -647,10 +1050,11 @@ class PlexPlaylistMakerGUI(ctk.CTk):
             self.queue_handler.suppress_connection_errors = not self.queue_handler.suppress_connection_errors
             state = 'ON' if not self.queue_handler.suppress_connection_errors else 'OFF'
             # Inject an informational line so user knows the state changed
-            self.log_queue.put(f"[LOG FILTER] Connection error messages now {('visible' if state=='ON' else 'hidden')}.")
+            self.queue_handler.enqueue(f"[LOG FILTER] Connection error messages now {('visible' if state=='ON' else 'hidden')}.")
 
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Needed for the fuzzy process pool in frozen builds
     app = PlexPlaylistMakerGUI()
     app.mainloop()
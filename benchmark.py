@@ -0,0 +1,189 @@
+"""Offline benchmarks for PlexPlaylistMaker (no network or Plex server needed).
+
+Usage:
+    python benchmark.py memory [--items 10000] [--per-page 100]
+    python benchmark.py assemble [--sizes 1000,5000,20000]
+    python benchmark.py startup [--repeat 5] [--budget-ms 400]
+
+memory: parses a synthetic Letterboxd list page by page (served from memory
+instead of letterboxd.com) and reports parse time, the peak Python heap
+(tracemalloc) and the process peak RSS.
+
+assemble: times post-match result assembly (MatchReport) for growing list
+sizes; the per-item cost should stay flat.
+
+startup: times a cold import of the controller and GUI modules in fresh
+interpreters (median of --repeat runs) and checks that imdb, bs4 and
+plexapi were not pulled in. Exits non-zero when the controller import is
+over --budget-ms or a deferred module was imported eagerly.
+"""
+import argparse
+import logging
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from PlexPlaylistMakerController import IndexedItem, ListEntry, MatchReport, PlexLetterboxdApp
+
+LIST_URL = 'https://letterboxd.com/bench/list/synthetic/'
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class _SyntheticListSession:
+    """Stands in for the HTTP session: renders list pages shaped like Letterboxd's markup."""
+
+    def __init__(self, items, per_page):
+        self.items = items
+        self.per_page = per_page
+        self.pages = -(-items // per_page)
+
+    def _render(self, page):
+        start = (page - 1) * self.per_page
+        posters = []
+        for i in range(start, min(start + self.per_page, self.items)):
+            posters.append(
+                f'<li class="poster-container"><div class="really-lazy-load poster film-poster" '
+                f'data-film-id="{i}" data-film-slug="film-{i}" data-film-name="Film {i}" '
+                f'data-film-release-year="{1950 + i % 70}"><img alt="Film {i}" src="/p/{i}.jpg"/>'
+                f'<span class="frame-title">Film {i}</span></div></li>')
+        nav = ''.join(f'<li><a href="/bench/list/synthetic/page/{p}/">{p}</a></li>'
+                      for p in range(max(1, page - 3), min(self.pages, page + 3) + 1))
+        filler = '<div class="sidebar">' + '<p>lorem ipsum</p>' * 400 + '</div>'
+        return (f'<html><head><title>List</title></head><body><h1>Synthetic</h1>'
+                f'<ul class="poster-list">{"".join(posters)}</ul><div class="pagination">{nav}</div>'
+                f'<a href="/bench/list/synthetic/page/{self.pages}/">last</a>{filler}</body></html>')
+
+    def get(self, url, **kwargs):
+        m = re.search(r'/page/(\d+)/', url)
+        page = int(m.group(1)) if m else 1
+        text = self._render(page) if page <= self.pages else '<html><body></body></html>'
+        return SimpleNamespace(text=text, status_code=200, raise_for_status=lambda: None)
+
+    def close(self):
+        pass
+
+
+def bench_memory(args):
+    app = PlexLetterboxdApp()
+    app.SESSION = _SyntheticListSession(args.items, args.per_page)
+    app.MAX_LIST_PAGES = app.SESSION.pages
+    tracemalloc.start()
+    start = time.perf_counter()
+    entries = []
+    for page_items in app.iter_letterboxd_list_pages(LIST_URL):
+        entries.extend(page_items)  # What a run keeps: the compact entries only
+    elapsed = time.perf_counter() - start
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss = _peak_rss_mb()
+    print(f"entries={len(entries)} pages={app.SESSION.pages} parse={elapsed:.2f}s "
+          f"({len(entries) / elapsed:.0f} entries/s) heap_peak={peak / (1024 * 1024):.1f}MB"
+          + (f" peak_rss={rss:.1f}MB" if rss is not None else ""))
+
+
+def _synthetic_results(n):
+    """(entry, record_or_None) pairs in shuffled arrival order: ~70% matched, some duplicate titles."""
+    rng = random.Random(n)
+    results = []
+    for pos in range(1, n + 1):
+        title = f"Film {pos % (n // 10 or 1)}" if pos % 10 == 0 else f"Film {pos}"
+        entry = ListEntry(pos, title, 1950 + pos % 70, slug=f"film-{pos}", film_id=str(pos))
+        record = IndexedItem(pos % (n // 2 or 1) + 1, title, entry.year) if rng.random() < 0.7 else None
+        results.append((entry, record))
+    rng.shuffle(results)
+    return results
+
+
+def bench_assemble(args):
+    for n in (int(x) for x in args.sizes.split(',')):
+        results = _synthetic_results(n)
+        start = time.perf_counter()
+        match = MatchReport(results)
+        details = match.unmatched_details()
+        elapsed = time.perf_counter() - start
+        print(f"entries={n:>6} matched={len(match.matched_items):>6} unmatched={len(details):>6} "
+              f"assemble={elapsed * 1000:8.1f}ms per_item={elapsed / n * 1e6:6.2f}us")
+
+
+DEFERRED_MODULES = ('imdb', 'bs4', 'plexapi')
+
+_STARTUP_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+eager = [m for m in {deferred!r} if m in sys.modules]
+print(elapsed, ','.join(eager))
+"""
+
+
+def _time_import(module):
+    """Seconds to import ``module`` in a fresh interpreter, plus any deferred modules it loaded."""
+    code = _STARTUP_PROBE.format(module=module, deferred=DEFERRED_MODULES)
+    proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                          cwd=os.path.dirname(os.path.abspath(__file__)))
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'import failed')
+    elapsed, _, eager = proc.stdout.strip().rpartition('\n')[2].partition(' ')
+    return float(elapsed), [m for m in eager.split(',') if m]
+
+
+def bench_startup(args):
+    ok = True
+    for module in ('PlexPlaylistMakerController', 'PlexPlaylistMakerGUI'):
+        try:
+            runs = [_time_import(module) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"{module}: skipped ({e})")
+            continue
+        median_ms = statistics.median(t for t, _ in runs) * 1000
+        eager = sorted({m for _, mods in runs for m in mods})
+        line = f"{module}: import={median_ms:.0f}ms (median of {args.repeat})"
+        if eager:
+            line += f" eager={','.join(eager)}"
+            ok = False
+        if module == 'PlexPlaylistMakerController':
+            within = median_ms <= args.budget_ms
+            ok = ok and within
+            line += f" budget={args.budget_ms:.0f}ms {'OK' if within else 'OVER'}"
+        print(line)
+    if not ok:
+        sys.exit(1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='command', required=True)
+    mem = sub.add_parser('memory', help='Peak memory while parsing a large Letterboxd list')
+    mem.add_argument('--items', type=int, default=10000)
+    mem.add_argument('--per-page', type=int, default=100)
+    mem.set_defaults(func=bench_memory)
+    asm = sub.add_parser('assemble', help='Result assembly cost per item as the list grows')
+    asm.add_argument('--sizes', default='1000,5000,20000')
+    asm.set_defaults(func=bench_assemble)
+    st = sub.add_parser('startup', help='Cold import time of the app modules against a budget')
+    st.add_argument('--repeat', type=int, default=5)
+    st.add_argument('--budget-ms', type=float, default=400)
+    st.set_defaults(func=bench_startup)
+    args = parser.parse_args(argv)
+    logging.getLogger().setLevel(logging.WARNING)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
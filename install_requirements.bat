@@ -1,6 +1,6 @@
 @echo off
 echo Installing required packages with current Python interpreter...
 python -m pip install --upgrade pip
-python -m pip install requests plexapi beautifulsoup4 imdbpy Pillow customtkinter CTkMessagebox
+python -m pip install requests plexapi beautifulsoup4 imdbpy Pillow customtkinter CTkMessagebox keyring
 echo Installation complete.
 pause